@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, Dict, List
@@ -21,10 +22,17 @@ except LookupError:
 # ======================================================
 # ✅ IMPORTS AFTER NLTK FIX
 # ======================================================
-from inference.predict_emotion import predict_emotion
+from inference.predict_emotion import predict_emotion, warm_up
 from chatbot.reply_manager import generate_reply
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    # load models before the first request instead of during it
+    warm_up()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 class ChatRequest(BaseModel):
@@ -35,6 +35,18 @@ ENABLE_LINGUISTIC_FEATURES = True
 # Extracts: polarity, subjectivity, emotional intensity
 ENABLE_SENTIMENT_FEATURES = True
 
+# Worker processes for batch feature extraction (1 = in-process, -1 = all cores)
+# Only large batches (e.g. training corpora) are split across workers
+FEATURE_EXTRACTION_N_JOBS = 1
+
+# Directory for caching TF-IDF batch transforms on disk (None = no caching)
+# Speeds up repeated runs over the same corpus (cross-validation, sweeps)
+TFIDF_CACHE_DIR = None
+
+# Use stateless hashing vectorizers instead of the fitted TF-IDF vocabularies
+# No vectorizer files to load, but models must be trained on hashed features
+TFIDF_USE_HASHING = False
+
 
 # =============================================================================
 # CONTEXT WINDOW (Message History)
@@ -141,6 +153,17 @@ MODELS = {
 }
 
 
+# =============================================================================
+# API SERVING
+# =============================================================================
+
+# /predict requests arriving within this window (ms) are scored as one batch
+PREDICT_BATCH_WINDOW_MS = 2
+
+# Upper bound on texts scored together in one /predict batch
+PREDICT_MAX_BATCH_SIZE = 64
+
+
 # =============================================================================
 # LOGGING
 # =============================================================================
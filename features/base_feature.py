@@ -15,11 +15,116 @@ REQUIREMENTS FOR SUBCLASSES:
 
 from abc import ABC, abstractmethod
 import numpy as np
-from typing import Union, List
+import re
+from joblib import Parallel, delayed, effective_n_jobs
+from typing import Union, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Word pattern shared by the lexicon-based extractors
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Sentence-ending punctuation shared by the sentence-level extractors
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+_NONSPACE_PATTERN = re.compile(r'\S')
+
+# Maps every ASCII non-word character to a space
+_ASCII_NONWORD_TABLE = str.maketrans({
+    chr(c): ' ' for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == '_')
+})
+
+
+def tokenize_words(text: str) -> List[str]:
+    """
+    Split text into words, equivalent to WORD_PATTERN.findall(text).
+
+    ASCII text (the common case) is tokenized with str.translate + str.split,
+    which runs entirely in C. Other text falls back to the regex.
+
+    Args:
+        text: Input text (callers lowercase it first)
+
+    Returns:
+        List of word tokens
+    """
+    if text.isascii():
+        return text.translate(_ASCII_NONWORD_TABLE).split()
+    return WORD_PATTERN.findall(text)
+
+
+def tokenize_sentences(text: str) -> List[List[str]]:
+    """
+    Split text into sentences of words, equivalent to calling
+    tokenize_words() on every non-blank segment of SENTENCE_PATTERN.split(text).
+
+    Text without sentence-ending punctuation (most chat messages) is a
+    single sentence and skips the split. ASCII text is tokenized per
+    segment; other text uses one regex word scan bucketed by segment
+    offsets. Concatenating the sentences gives tokenize_words(text).
+
+    Args:
+        text: Input text (callers lowercase it first)
+
+    Returns:
+        List of per-sentence word lists (empty for blank text)
+    """
+    if '.' not in text and '!' not in text and '?' not in text:
+        return [tokenize_words(text)] if text.strip() else []
+
+    if text.isascii():
+        return [
+            tokenize_words(segment)
+            for segment in SENTENCE_PATTERN.split(text)
+            if segment.strip()
+        ]
+
+    # Segment offsets between runs of sentence-ending punctuation
+    starts = [0]
+    ends = []
+    for m in SENTENCE_PATTERN.finditer(text):
+        ends.append(m.start())
+        starts.append(m.end())
+    ends.append(len(text))
+
+    # One word scan over the whole text, bucketed by segment
+    segments: List[List[str]] = [[] for _ in starts]
+    j = 0
+    for m in WORD_PATTERN.finditer(text):
+        pos = m.start()
+        while pos >= ends[j]:
+            j += 1
+        segments[j].append(m.group())
+
+    return [
+        segments[k] for k in range(len(starts))
+        if _NONSPACE_PATTERN.search(text, starts[k], ends[k])
+    ]
+
+
+def balanced_chunks(texts: List[str], n_chunks: int) -> Tuple[List[List[str]], np.ndarray]:
+    """
+    Split texts into chunks of similar total length for parallel workers.
+
+    Texts are sorted by length and dealt round-robin, so the few very long
+    texts of a batch are spread over all chunks instead of stalling one.
+
+    Args:
+        texts: List of input text strings
+        n_chunks: Number of chunks (capped at len(texts))
+
+    Returns:
+        Tuple of (chunks, restore): indexing the stacked per-chunk results
+        with restore gives rows in the original text order
+    """
+    n_chunks = max(min(n_chunks, len(texts)), 1)
+    order = np.argsort([len(text) for text in texts], kind='stable')[::-1]
+    positions = [order[k::n_chunks] for k in range(n_chunks)]
+    chunks = [[texts[i] for i in pos] for pos in positions]
+    restore = np.argsort(np.concatenate(positions))
+    return chunks, restore
+
 
 class BaseFeatureExtractor(ABC):
     """
@@ -35,6 +140,10 @@ class BaseFeatureExtractor(ABC):
     When disabled, FeatureManager will skip this extractor entirely.
     """
 
+    # Batches smaller than this always run in-process (worker startup and
+    # pickling cost more than the extraction itself)
+    PARALLEL_MIN_BATCH = 1000
+
     def __init__(self, name: str):
         """
         Initialize the feature extractor.
@@ -73,10 +182,45 @@ class BaseFeatureExtractor(ABC):
         """
         pass
 
-    def extract_batch(self, texts: List[str]) -> np.ndarray:
+    def extract_batch(self, texts: List[str], n_jobs: int = 1) -> np.ndarray:
         """
         Extract features from multiple texts.
 
+        Args:
+            texts: List of input text strings
+            n_jobs: Number of worker processes (-1 for all cores). Batches
+                smaller than PARALLEL_MIN_BATCH are always extracted in-process.
+
+        Returns:
+            np.ndarray: Feature matrix of shape (n_texts, output_dim)
+        """
+        if n_jobs != 1 and len(texts) >= self.PARALLEL_MIN_BATCH:
+            return self._extract_batch_parallel(texts, n_jobs)
+        return self._extract_batch_serial(texts)
+
+    def _extract_batch_parallel(self, texts: List[str], n_jobs: int) -> np.ndarray:
+        """
+        Split texts into one length-balanced chunk per worker and extract in parallel.
+
+        Args:
+            texts: List of input text strings
+            n_jobs: Number of worker processes (-1 for all cores)
+
+        Returns:
+            np.ndarray: Feature matrix of shape (n_texts, output_dim)
+        """
+        n_workers = effective_n_jobs(n_jobs)
+        chunks, restore = balanced_chunks(texts, n_workers)
+
+        results = Parallel(n_jobs=n_workers)(
+            delayed(self.extract_batch)(chunk) for chunk in chunks
+        )
+        return np.vstack(results)[restore]
+
+    def _extract_batch_serial(self, texts: List[str]) -> np.ndarray:
+        """
+        Extract features text by text in the current process.
+
         Args:
             texts: List of input text strings
 
@@ -100,7 +244,7 @@ class BaseFeatureExtractor(ABC):
         Returns:
             np.ndarray: Zero vector of shape (output_dim,)
         """
-        return np.zeros(self.output_dim)
+        return np.zeros(self.output_dim, dtype=np.float32)
 
     def fit(self, texts: List[str], y=None):
         """
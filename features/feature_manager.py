@@ -121,7 +121,9 @@ class FeatureManager:
             try:
                 extractor = TfidfFeatureExtractor(
                     word_vectorizer_path=tfidf_word_path,
-                    char_vectorizer_path=tfidf_char_path
+                    char_vectorizer_path=tfidf_char_path,
+                    cache_dir=config.TFIDF_CACHE_DIR,
+                    use_hashing=config.TFIDF_USE_HASHING
                 )
                 self._add_extractor('tfidf', extractor)
                 logger.info(f"Loaded TF-IDF features (dim={extractor.output_dim})")
@@ -238,11 +240,11 @@ class FeatureManager:
             except Exception as e:
                 logger.warning(f"Error extracting {name} features: {e}")
                 # Return zeros for failed extractor
-                features_list.append(np.zeros(extractor.output_dim))
+                features_list.append(np.zeros(extractor.output_dim, dtype=np.float32))
 
         if not features_list:
             logger.error("No features extracted!")
-            return np.zeros(self._output_dim)
+            return np.zeros(self._output_dim, dtype=np.float32)
 
         return np.concatenate(features_list)
 
@@ -257,14 +259,16 @@ class FeatureManager:
             np.ndarray: Feature matrix of shape (n_texts, output_dim)
         """
         if not texts:
-            return np.zeros((0, self._output_dim))
+            return np.zeros((0, self._output_dim), dtype=np.float32)
 
         features_list = []
 
         for name in self._extractor_order:
             extractor = self.extractors[name]
             try:
-                features = extractor.extract_batch(texts)
+                features = extractor.extract_batch(
+                    texts, n_jobs=config.FEATURE_EXTRACTION_N_JOBS
+                )
 
                 # Convert sparse to dense if needed
                 if issparse(features):
@@ -275,10 +279,10 @@ class FeatureManager:
             except Exception as e:
                 logger.warning(f"Error extracting {name} features: {e}")
                 # Return zeros for failed extractor
-                features_list.append(np.zeros((len(texts), extractor.output_dim)))
+                features_list.append(np.zeros((len(texts), extractor.output_dim), dtype=np.float32))
 
         if not features_list:
-            return np.zeros((len(texts), self._output_dim))
+            return np.zeros((len(texts), self._output_dim), dtype=np.float32)
 
         return np.hstack(features_list)
 
@@ -26,11 +26,11 @@ CONFIG FLAG: ENABLE_LEXICON_FEATURES
 """
 
 import numpy as np
-import re
 from typing import List, Dict, Set
 import logging
+from scipy.sparse import csr_matrix
 
-from .base_feature import BaseFeatureExtractor
+from .base_feature import BaseFeatureExtractor, tokenize_words
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,9 @@ class LexiconFeatureExtractor(BaseFeatureExtractor):
     # Emotion categories
     EMOTIONS = ['fear', 'sadness', 'anger', 'joy', 'trust', 'anticipation', 'disgust', 'surprise']
 
+    # Column of each emotion in the packed intensity matrix
+    EMOTION_IDX = dict(zip(EMOTIONS, range(len(EMOTIONS))))
+
     def __init__(self):
         """Initialize with built-in emotion lexicon."""
         super().__init__(name='lexicon')
@@ -68,8 +71,15 @@ class LexiconFeatureExtractor(BaseFeatureExtractor):
 
         Each word maps to a dict of {emotion: intensity} where intensity is 0.0-1.0.
         This is a curated lexicon optimized for mental health/workplace contexts.
+
+        Words are also packed into a (n_words, 8) intensity matrix whose columns
+        follow EMOTIONS. Words listed under several emotions (e.g. 'excited' in
+        joy and anticipation) share a single row with several columns set, so
+        scoring a word is one row add regardless of how many emotions it has.
         """
         self.lexicon: Dict[str, Dict[str, float]] = {}
+        self._word_index: Dict[str, int] = {}
+        self._intensity_rows: List[List[float]] = []
 
         # Fear/Anxiety words
         fear_words = {
@@ -180,13 +190,19 @@ class LexiconFeatureExtractor(BaseFeatureExtractor):
         for word, intensity in surprise_words.items():
             self._add_emotion(word, 'surprise', intensity)
 
+        self._intensity_matrix = np.array(self._intensity_rows)
+        del self._intensity_rows
+
         logger.info(f"Lexicon loaded with {len(self.lexicon)} words")
 
     def _add_emotion(self, word: str, emotion: str, intensity: float):
-        """Add word-emotion mapping to lexicon."""
+        """Add word-emotion mapping to lexicon and its intensity matrix row."""
         if word not in self.lexicon:
             self.lexicon[word] = {}
+            self._word_index[word] = len(self._intensity_rows)
+            self._intensity_rows.append([0.0] * len(self.EMOTIONS))
         self.lexicon[word][emotion] = intensity
+        self._intensity_rows[self._word_index[word]][self.EMOTION_IDX[emotion]] = intensity
 
     @property
     def output_dim(self) -> int:
@@ -206,45 +222,67 @@ class LexiconFeatureExtractor(BaseFeatureExtractor):
         try:
             # Normalize text and extract words
             text_lower = text.lower()
-            words = re.findall(r'\b\w+\b', text_lower)
+            words = tokenize_words(text_lower)
             word_count = len(words) if words else 1
 
-            # Initialize emotion scores
-            scores = {emotion: 0.0 for emotion in self.EMOTIONS}
-
-            # Accumulate scores from lexicon matches
-            matches = 0
-            for word in words:
-                if word in self.lexicon:
-                    matches += 1
-                    for emotion, intensity in self.lexicon[word].items():
-                        scores[emotion] += intensity
-
-            # Normalize by word count (to handle different text lengths)
-            if matches > 0:
-                for emotion in scores:
-                    scores[emotion] = scores[emotion] / word_count
-                    # Clip to [0, 1] range
-                    scores[emotion] = min(1.0, scores[emotion])
-
-            # Build feature vector in consistent order
-            features = np.array([
-                scores['fear'],
-                scores['sadness'],
-                scores['anger'],
-                scores['joy'],
-                scores['trust'],
-                scores['anticipation'],
-                scores['disgust'],
-                scores['surprise']
-            ], dtype=np.float32)
-
-            return features
+            # Look up lexicon rows for matched words
+            word_index = self._word_index
+            rows = [word_index[word] for word in words if word in word_index]
+
+            # No matches -> all emotion scores are zero
+            if not rows:
+                return np.zeros(self.OUTPUT_DIM, dtype=np.float32)
+
+            # Accumulate scores from lexicon matches (columns follow EMOTIONS)
+            scores = self._intensity_matrix[rows].sum(axis=0)
+
+            # Normalize by word count and clip to [0, 1] range
+            return np.minimum(scores / word_count, 1.0).astype(np.float32)
 
         except Exception as e:
             logger.error(f"Lexicon features extraction error: {e}")
             return self._get_zero_features()
 
+    def extract_batch(self, texts: List[str], n_jobs: int = 1) -> np.ndarray:
+        """
+        Extract emotion lexicon scores from multiple texts.
+
+        Matched lexicon rows of every text are collected into a sparse
+        (n_texts, n_words) count matrix and scored with a single product
+        against the intensity matrix, so this path is already vectorized
+        and does not use worker processes.
+
+        Args:
+            texts: List of input texts
+            n_jobs: Ignored (kept for interface compatibility)
+
+        Returns:
+            np.ndarray: Feature matrix of shape (n_texts, 8)
+        """
+        word_index = self._word_index
+        flat_rows: List[int] = []
+        doc_offsets = [0]
+        word_counts = np.ones(len(texts))
+
+        for i, text in enumerate(texts):
+            try:
+                words = tokenize_words(text.lower())
+            except Exception as e:
+                logger.warning(f"{self.name}: Error extracting features: {e}")
+                words = []
+
+            flat_rows.extend(word_index[word] for word in words if word in word_index)
+            doc_offsets.append(len(flat_rows))
+            word_counts[i] = len(words) if words else 1
+
+        counts = csr_matrix(
+            (np.ones(len(flat_rows)), flat_rows, doc_offsets),
+            shape=(len(texts), len(word_index))
+        )
+        scores = counts @ self._intensity_matrix
+
+        return np.minimum(scores / word_counts[:, None], 1.0).astype(np.float32)
+
     def get_emotion_breakdown(self, text: str) -> Dict[str, float]:
         """
         Get detailed emotion breakdown for interpretability.
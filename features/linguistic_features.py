@@ -23,11 +23,13 @@ CONFIG FLAG: ENABLE_LINGUISTIC_FEATURES
 """
 
 import numpy as np
-import re
-from typing import List, Set
+from itertools import chain
+from typing import Dict, FrozenSet, List, Tuple
 import logging
 
-from .base_feature import BaseFeatureExtractor
+from .base_feature import (
+    BaseFeatureExtractor, SENTENCE_PATTERN, tokenize_sentences, tokenize_words
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +56,7 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
         self._is_fitted = True  # No fitting required
 
         # Negation words
-        self.negation_words: Set[str] = {
+        self.negation_words: FrozenSet[str] = frozenset({
             'not', 'no', 'never', 'none', 'nothing', 'nowhere', 'neither',
             'nobody', 'cant', "can't", 'cannot', 'wont', "won't", 'dont',
             "don't", 'doesnt', "doesn't", 'didnt', "didn't", 'isnt', "isn't",
@@ -62,26 +64,46 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
             'havent', "haven't", 'hasnt', "hasn't", 'hadnt', "hadn't",
             'wouldnt', "wouldn't", 'couldnt', "couldn't", 'shouldnt', "shouldn't",
             'without', 'hardly', 'barely', 'scarcely', 'seldom', 'rarely'
-        }
+        })
 
         # First-person pronouns
-        self.first_person_pronouns: Set[str] = {
+        self.first_person_pronouns: FrozenSet[str] = frozenset({
             'i', 'me', 'my', 'mine', 'myself',
             'we', 'us', 'our', 'ours', 'ourselves'
-        }
+        })
 
         # Second-person pronouns (for contrast)
-        self.second_person_pronouns: Set[str] = {
+        self.second_person_pronouns: FrozenSet[str] = frozenset({
             'you', 'your', 'yours', 'yourself', 'yourselves'
-        }
+        })
 
         # Third-person pronouns
-        self.third_person_pronouns: Set[str] = {
+        self.third_person_pronouns: FrozenSet[str] = frozenset({
             'he', 'him', 'his', 'himself',
             'she', 'her', 'hers', 'herself',
             'it', 'its', 'itself',
             'they', 'them', 'their', 'theirs', 'themselves'
-        }
+        })
+
+        self._build_word_ids()
+
+    def _build_word_ids(self):
+        """
+        Assign an id to every word counted by extract().
+
+        Membership in each counted set is stored as a uint8 array indexed by
+        id, so a text is classified with one dict probe per word and the
+        counts become NumPy reductions over the matched ids.
+        """
+        vocab = sorted(self.negation_words | self.first_person_pronouns)
+        self._word_to_id: Dict[str, int] = {word: i for i, word in enumerate(vocab)}
+
+        self._is_negation = np.fromiter(
+            (word in self.negation_words for word in vocab), dtype=np.uint8, count=len(vocab)
+        )
+        self._is_first_person = np.fromiter(
+            (word in self.first_person_pronouns for word in vocab), dtype=np.uint8, count=len(vocab)
+        )
 
     @property
     def output_dim(self) -> int:
@@ -99,15 +121,30 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
             List of sentence strings
         """
         # Split on sentence-ending punctuation
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_PATTERN.split(text)
         # Filter empty sentences and strip whitespace
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences if sentences else ['']
 
-    def _count_words(self, text: str) -> int:
-        """Count words in text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return len(words)
+    def _scan_sentences(self, text_lower: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Tokenize text and count words per sentence.
+
+        Sentence boundaries match _split_sentences(): blank segments are
+        dropped, and text without any sentence yields a single empty one.
+
+        Args:
+            text_lower: Lowercased input text
+
+        Returns:
+            Tuple of (all words, per-sentence word counts as int32 array)
+        """
+        sentences = tokenize_sentences(text_lower)
+        words = list(chain.from_iterable(sentences))
+        sentence_lengths = np.fromiter(map(len, sentences), dtype=np.int32, count=len(sentences))
+        if not sentence_lengths.size:
+            sentence_lengths = np.zeros(1, dtype=np.int32)
+        return words, sentence_lengths
 
     def extract(self, text: str) -> np.ndarray:
         """
@@ -120,27 +157,26 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
             np.ndarray: Feature vector of shape (6,)
         """
         try:
-            # Split into sentences
-            sentences = self._split_sentences(text)
-            num_sentences = max(len(sentences), 1)
-
-            # Get words
-            words = re.findall(r'\b\w+\b', text.lower())
+            # Split into sentences and get words in one scan
+            words, sentence_lengths = self._scan_sentences(text.lower())
+            num_sentences = max(sentence_lengths.size, 1)
             word_count = max(len(words), 1)
-            word_set = set(words)
 
             # 1. Average sentence length (normalized by log)
-            sentence_lengths = [self._count_words(s) for s in sentences]
-            avg_sentence_length = np.mean(sentence_lengths) if sentence_lengths else 0
+            avg_sentence_length = sentence_lengths.mean() if sentence_lengths.size else 0.0
             # Normalize: typical sentences are 10-20 words
             avg_sentence_length_norm = min(avg_sentence_length / 25.0, 1.0)
 
+            # Ids of words that belong to any counted set (single traversal)
+            word_to_id = self._word_to_id
+            ids = [word_to_id[w] for w in words if w in word_to_id]
+
             # 2. Negation count (normalized by word count)
-            negation_count = sum(1 for w in words if w in self.negation_words)
+            negation_count = int(self._is_negation[ids].sum())
             negation_ratio = negation_count / word_count
 
             # 3. First-person pronoun ratio
-            first_person_count = sum(1 for w in words if w in self.first_person_pronouns)
+            first_person_count = int(self._is_first_person[ids].sum())
             first_person_ratio = first_person_count / word_count
 
             # 4. Question mark count (normalized)
@@ -152,7 +188,7 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
             exclamation_ratio = min(exclamation_count / num_sentences, 1.0)
 
             # 6. Short sentence ratio (sentences with < 5 words)
-            short_sentences = sum(1 for length in sentence_lengths if length < 5)
+            short_sentences = int((sentence_lengths < 5).sum())
             short_sentence_ratio = short_sentences / num_sentences
 
             # Build feature vector
@@ -182,7 +218,7 @@ class LinguisticFeatureExtractor(BaseFeatureExtractor):
             Dict with detailed linguistic metrics
         """
         sentences = self._split_sentences(text)
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = tokenize_words(text.lower())
         word_count = len(words)
 
         return {
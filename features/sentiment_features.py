@@ -23,13 +23,35 @@ CONFIG FLAG: ENABLE_SENTIMENT_FEATURES
 
 import numpy as np
 import re
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 import logging
 
-from .base_feature import BaseFeatureExtractor
+from .base_feature import BaseFeatureExtractor, tokenize_sentences, tokenize_words
 
 logger = logging.getLogger(__name__)
 
+# Max number of distinct texts (and sentences) whose results are memoized.
+# The memoized calculators are classmethods over the class-level lexicons,
+# so the caches are keyed on (class, text) and never hold an instance.
+_CACHE_SIZE = 100_000
+
+# Word categories in the combined polarity lookup
+_NEGATOR = 0
+_MODIFIER = 1     # intensifier or diminisher (scales the next sentiment word)
+_SENTIMENT = 2    # positive or negative word
+
+# Features of a text without any words: neutral polarity, everything else 0
+_NEUTRAL_VALUES = (0.5, 0.0, 0.0, 0.0)
+_NEUTRAL = np.array(_NEUTRAL_VALUES, dtype=np.float32)
+_NEUTRAL.setflags(write=False)
+
+# Precompiled patterns shared by all extractor instances
+_CAPS_RE = re.compile(r'[A-Z]{2,}')
+_ELONG_RE = re.compile(r'(.)\1{2,}')
+
 
 class SentimentFeatureExtractor(BaseFeatureExtractor):
     """
@@ -47,100 +69,202 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
     # Output dimension
     OUTPUT_DIM = 4
 
+    # Sentiment lexicons (class-level and read-only, shared by all instances)
+    # Positive words with polarity scores (0.1 to 1.0)
+    positive_words: Mapping[str, float] = MappingProxyType({
+        # Strong positive (0.8-1.0)
+        'excellent': 1.0, 'amazing': 1.0, 'wonderful': 1.0, 'fantastic': 0.95,
+        'outstanding': 0.95, 'incredible': 0.95, 'brilliant': 0.95, 'perfect': 1.0,
+        'love': 0.9, 'adore': 0.9, 'thrilled': 0.9, 'ecstatic': 0.95,
+        # Medium positive (0.5-0.8)
+        'good': 0.6, 'great': 0.75, 'nice': 0.5, 'happy': 0.7, 'pleased': 0.65,
+        'glad': 0.6, 'delighted': 0.8, 'satisfied': 0.6, 'content': 0.55,
+        'enjoy': 0.65, 'like': 0.5, 'appreciate': 0.6, 'grateful': 0.7,
+        # Mild positive (0.2-0.5)
+        'okay': 0.3, 'fine': 0.35, 'decent': 0.4, 'acceptable': 0.35,
+        'interesting': 0.4, 'helpful': 0.5, 'useful': 0.45, 'pleasant': 0.5
+    })
+
+    # Negative words with polarity scores (-0.1 to -1.0)
+    negative_words: Mapping[str, float] = MappingProxyType({
+        # Strong negative (-0.8 to -1.0)
+        'terrible': -1.0, 'horrible': -1.0, 'awful': -0.95, 'dreadful': -0.95,
+        'hate': -0.9, 'despise': -0.95, 'loathe': -0.95, 'worst': -1.0,
+        'devastating': -0.95, 'catastrophic': -1.0, 'disgusting': -0.9,
+        # Medium negative (-0.5 to -0.8)
+        'bad': -0.6, 'poor': -0.55, 'wrong': -0.5, 'sad': -0.6, 'unhappy': -0.65,
+        'upset': -0.6, 'angry': -0.7, 'frustrated': -0.65, 'disappointed': -0.6,
+        'annoyed': -0.55, 'irritated': -0.55, 'worried': -0.6, 'anxious': -0.65,
+        # Mild negative (-0.2 to -0.5)
+        'boring': -0.4, 'dull': -0.35, 'mediocre': -0.3, 'meh': -0.25,
+        'difficult': -0.35, 'hard': -0.3, 'challenging': -0.25, 'confusing': -0.4
+    })
+
+    # Intensifiers (multiply polarity)
+    intensifiers: Mapping[str, float] = MappingProxyType({
+        'very': 1.5, 'really': 1.4, 'extremely': 1.8, 'incredibly': 1.7,
+        'absolutely': 1.8, 'totally': 1.5, 'completely': 1.6, 'utterly': 1.7,
+        'highly': 1.4, 'deeply': 1.5, 'strongly': 1.4, 'seriously': 1.4,
+        'so': 1.3, 'too': 1.2, 'quite': 1.2, 'rather': 1.1
+    })
+
+    # Diminishers (reduce polarity)
+    diminishers: Mapping[str, float] = MappingProxyType({
+        'slightly': 0.5, 'somewhat': 0.6, 'a bit': 0.6, 'kind of': 0.5,
+        'sort of': 0.5, 'a little': 0.5, 'barely': 0.3, 'hardly': 0.3,
+        'almost': 0.7, 'nearly': 0.7
+    })
+
+    # Negators (flip polarity)
+    negators: FrozenSet[str] = frozenset({
+        'not', 'no', 'never', 'neither', 'nobody', 'nothing', 'nowhere',
+        "n't", 'nt', 'cant', 'wont', 'dont', 'isnt', 'arent', 'wasnt'
+    })
+
+    # Subjective words (indicate opinion vs fact)
+    subjective_words: FrozenSet[str] = frozenset({
+        'think', 'feel', 'believe', 'opinion', 'seems', 'appears',
+        'probably', 'maybe', 'perhaps', 'might', 'could', 'would',
+        'personally', 'honestly', 'frankly', 'actually', 'basically',
+        'i', 'my', 'me', 'myself', 'we', 'our', 'us'
+    })
+
+    # High-intensity emotion words
+    intensity_words: FrozenSet[str] = frozenset({
+        'very', 'extremely', 'incredibly', 'absolutely', 'totally',
+        'completely', 'utterly', 'definitely', 'certainly', 'obviously',
+        '!', '!!', '!!!', '?!', 'omg', 'wow', 'god', 'damn', 'hell',
+        'fucking', 'freaking', 'bloody', 'shit', 'crap'
+    })
+
     def __init__(self):
-        """Initialize sentiment lexicons."""
+        """Initialize the sentiment feature extractor."""
         super().__init__(name='sentiment')
         self._is_fitted = True  # No fitting required
 
-        # Build sentiment lexicons
-        self._build_lexicons()
-
-    def _build_lexicons(self):
-        """Build sentiment word lexicons with polarity scores."""
-
-        # Positive words with polarity scores (0.1 to 1.0)
-        self.positive_words: Dict[str, float] = {
-            # Strong positive (0.8-1.0)
-            'excellent': 1.0, 'amazing': 1.0, 'wonderful': 1.0, 'fantastic': 0.95,
-            'outstanding': 0.95, 'incredible': 0.95, 'brilliant': 0.95, 'perfect': 1.0,
-            'love': 0.9, 'adore': 0.9, 'thrilled': 0.9, 'ecstatic': 0.95,
-            # Medium positive (0.5-0.8)
-            'good': 0.6, 'great': 0.75, 'nice': 0.5, 'happy': 0.7, 'pleased': 0.65,
-            'glad': 0.6, 'delighted': 0.8, 'satisfied': 0.6, 'content': 0.55,
-            'enjoy': 0.65, 'like': 0.5, 'appreciate': 0.6, 'grateful': 0.7,
-            # Mild positive (0.2-0.5)
-            'okay': 0.3, 'fine': 0.35, 'decent': 0.4, 'acceptable': 0.35,
-            'interesting': 0.4, 'helpful': 0.5, 'useful': 0.45, 'pleasant': 0.5
-        }
-
-        # Negative words with polarity scores (-0.1 to -1.0)
-        self.negative_words: Dict[str, float] = {
-            # Strong negative (-0.8 to -1.0)
-            'terrible': -1.0, 'horrible': -1.0, 'awful': -0.95, 'dreadful': -0.95,
-            'hate': -0.9, 'despise': -0.95, 'loathe': -0.95, 'worst': -1.0,
-            'devastating': -0.95, 'catastrophic': -1.0, 'disgusting': -0.9,
-            # Medium negative (-0.5 to -0.8)
-            'bad': -0.6, 'poor': -0.55, 'wrong': -0.5, 'sad': -0.6, 'unhappy': -0.65,
-            'upset': -0.6, 'angry': -0.7, 'frustrated': -0.65, 'disappointed': -0.6,
-            'annoyed': -0.55, 'irritated': -0.55, 'worried': -0.6, 'anxious': -0.65,
-            # Mild negative (-0.2 to -0.5)
-            'boring': -0.4, 'dull': -0.35, 'mediocre': -0.3, 'meh': -0.25,
-            'difficult': -0.35, 'hard': -0.3, 'challenging': -0.25, 'confusing': -0.4
-        }
+    def __init_subclass__(cls, **kwargs):
+        """Subclasses may override the lexicons, so they get their own tables."""
+        super().__init_subclass__(**kwargs)
+        cls._build_lexicons()
 
-        # Intensifiers (multiply polarity)
-        self.intensifiers: Dict[str, float] = {
-            'very': 1.5, 'really': 1.4, 'extremely': 1.8, 'incredibly': 1.7,
-            'absolutely': 1.8, 'totally': 1.5, 'completely': 1.6, 'utterly': 1.7,
-            'highly': 1.4, 'deeply': 1.5, 'strongly': 1.4, 'seriously': 1.4,
-            'so': 1.3, 'too': 1.2, 'quite': 1.2, 'rather': 1.1
-        }
+    @classmethod
+    def _build_lexicons(cls):
+        """
+        Build the lookup tables derived from the class-level lexicons.
 
-        # Diminishers (reduce polarity)
-        self.diminishers: Dict[str, float] = {
-            'slightly': 0.5, 'somewhat': 0.6, 'a bit': 0.6, 'kind of': 0.5,
-            'sort of': 0.5, 'a little': 0.5, 'barely': 0.3, 'hardly': 0.3,
-            'almost': 0.7, 'nearly': 0.7
-        }
+        Runs once per class when it is defined (below the class body, and
+        from __init_subclass__), not from __init__: joblib workers unpickle
+        instances without calling __init__, and the tables are shared by
+        every instance rather than pickled with them.
+        """
+        cls._build_polarity_lookup()
+        cls._build_count_weights()
 
-        # Negators (flip polarity)
-        self.negators: set = {
-            'not', 'no', 'never', 'neither', 'nobody', 'nothing', 'nowhere',
-            "n't", 'nt', 'cant', 'wont', 'dont', 'isnt', 'arent', 'wasnt'
+    @classmethod
+    def _build_count_weights(cls):
+        """
+        Index the words counted by subjectivity/intensity for batch scoring.
+
+        Every counted word gets an id; _subjectivity_weights[id] is its
+        contribution to the subjectivity total (1 per subjective word plus
+        0.5 per opinion word) and _intensity_weights[id] is 1 for intensity
+        words. extract_batch() sums these per text with np.bincount.
+        _subjectivity_lookup maps the same weights by word for per-text
+        scoring.
+        """
+        vocab = sorted(
+            cls.subjective_words | cls.intensity_words
+            | set(cls.positive_words) | set(cls.negative_words)
+        )
+        cls._count_index: Dict[str, int] = {word: i for i, word in enumerate(vocab)}
+
+        subjectivity_weights = np.array([
+            (word in cls.subjective_words)
+            + 0.5 * (word in cls.positive_words or word in cls.negative_words)
+            for word in vocab
+        ])
+        intensity_weights = np.array(
+            [float(word in cls.intensity_words) for word in vocab]
+        )
+        subjectivity_weights.setflags(write=False)
+        intensity_weights.setflags(write=False)
+        cls._subjectivity_weights = subjectivity_weights
+        cls._intensity_weights = intensity_weights
+        cls._subjectivity_lookup: Dict[str, float] = {
+            word: weight for word, weight in zip(vocab, subjectivity_weights.tolist()) if weight
         }
 
-        # Subjective words (indicate opinion vs fact)
-        self.subjective_words: set = {
-            'think', 'feel', 'believe', 'opinion', 'seems', 'appears',
-            'probably', 'maybe', 'perhaps', 'might', 'could', 'would',
-            'personally', 'honestly', 'frankly', 'actually', 'basically',
-            'i', 'my', 'me', 'myself', 'we', 'our', 'us'
-        }
+    @classmethod
+    def _build_polarity_lookup(cls):
+        """
+        Combine the polarity lexicons into one word -> (category, value) dict.
 
-        # High-intensity emotion words
-        self.intensity_words: set = {
-            'very', 'extremely', 'incredibly', 'absolutely', 'totally',
-            'completely', 'utterly', 'definitely', 'certainly', 'obviously',
-            '!', '!!', '!!!', '?!', 'omg', 'wow', 'god', 'damn', 'hell',
-            'fucking', 'freaking', 'bloody', 'shit', 'crap'
-        }
+        _calculate_polarity() checks negators, intensifiers, diminishers,
+        positive and negative words in that order; the combined dict keeps
+        that precedence (later updates win) so each token needs one probe.
+        """
+        lookup: Dict[str, Tuple[int, float]] = {}
+        for word, score in cls.negative_words.items():
+            lookup[word] = (_SENTIMENT, score)
+        for word, score in cls.positive_words.items():
+            lookup[word] = (_SENTIMENT, score)
+        for word, factor in cls.diminishers.items():
+            lookup[word] = (_MODIFIER, factor)
+        for word, factor in cls.intensifiers.items():
+            lookup[word] = (_MODIFIER, factor)
+        for word in cls.negators:
+            lookup[word] = (_NEGATOR, 0.0)
+        cls._polarity_lookup = lookup
 
     @property
     def output_dim(self) -> int:
         """Return feature dimension."""
         return self.OUTPUT_DIM
 
-    def _calculate_polarity(self, text: str) -> float:
+    @classmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _calculate_polarity(cls, text: str) -> float:
         """
         Calculate overall sentiment polarity.
 
+        Memoized per text, so repeated texts are scored once.
+
         Args:
             text: Input text
 
         Returns:
             Polarity score from -1 (negative) to 1 (positive)
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        return cls._polarity_from_words(tokenize_words(text.lower()))
+
+    @classmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _sentence_polarity(cls, sentence_words: Tuple[str, ...]) -> float:
+        """
+        Polarity of one sentence, memoized on its tokens.
+
+        Sentences recurring across texts ("thank you", "i'm fine") are
+        scored once, without re-tokenizing the sentence text.
+
+        Args:
+            sentence_words: Lowercased words of the sentence
+
+        Returns:
+            Polarity score from -1 (negative) to 1 (positive)
+        """
+        return cls._polarity_from_words(sentence_words)
+
+    @classmethod
+    def _polarity_from_words(cls, words: List[str]) -> float:
+        """
+        Calculate sentiment polarity from lowercased word tokens.
+
+        Args:
+            words: Lowercased words of the text
+
+        Returns:
+            Polarity score from -1 (negative) to 1 (positive)
+        """
         if not words:
             return 0.0
 
@@ -149,39 +273,39 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         negation_active = False
         intensifier = 1.0
 
-        for i, word in enumerate(words):
+        # Only lexicon words change state, so walk just those. Words outside
+        # the lexicon matter only through the negation reset that happens at
+        # every index i > 0 with i % 3 == 0; that is replayed for the gap
+        # between consecutive hits below.
+        lookup = cls._polarity_lookup
+        hits = [(i, lookup[word]) for i, word in enumerate(words) if word in lookup]
+        prev = -1
+
+        for i, (category, score) in hits:
+            # Reset negation after a few words (skipped non-lexicon words)
+            if negation_active and max(3, (prev // 3 + 1) * 3) < i:
+                negation_active = False
+            prev = i
+
             # Check for negation
-            if word in self.negators:
+            if category == _NEGATOR:
                 negation_active = True
                 continue
 
-            # Check for intensifier
-            if word in self.intensifiers:
-                intensifier = self.intensifiers[word]
-                continue
-
-            # Check for diminisher
-            if word in self.diminishers:
-                intensifier = self.diminishers[word]
+            # Check for intensifier / diminisher
+            if category == _MODIFIER:
+                intensifier = score
                 continue
 
-            # Check sentiment words
-            score = 0.0
-            if word in self.positive_words:
-                score = self.positive_words[word]
-            elif word in self.negative_words:
-                score = self.negative_words[word]
-
-            if score != 0.0:
-                # Apply modifiers
-                if negation_active:
-                    score = -score * 0.8  # Flip but slightly reduced
-                    negation_active = False
-                score *= intensifier
-                intensifier = 1.0  # Reset
+            # Sentiment word: apply modifiers
+            if negation_active:
+                score = -score * 0.8  # Flip but slightly reduced
+                negation_active = False
+            score *= intensifier
+            intensifier = 1.0  # Reset
 
-                total_score += score
-                word_count += 1
+            total_score += score
+            word_count += 1
 
             # Reset negation after a few words
             if i > 0 and i % 3 == 0:
@@ -189,7 +313,7 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
 
         # Normalize
         if word_count > 0:
-            return np.clip(total_score / word_count, -1.0, 1.0)
+            return max(-1.0, min(total_score / word_count, 1.0))
         return 0.0
 
     def _calculate_subjectivity(self, text: str) -> float:
@@ -202,17 +326,25 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         Returns:
             Subjectivity score from 0 (objective) to 1 (subjective)
         """
-        words = re.findall(r'\b\w+\b', text.lower())
-        if not words:
-            return 0.0
+        return self._subjectivity_from_words(tokenize_words(text.lower()))
+
+    @classmethod
+    def _subjectivity_from_words(cls, words: List[str]) -> float:
+        """
+        Calculate subjectivity score from lowercased word tokens.
 
-        subjective_count = sum(1 for w in words if w in self.subjective_words)
+        Args:
+            words: Lowercased words of the text
 
-        # Also count opinion words
-        opinion_count = sum(1 for w in words if w in self.positive_words or w in self.negative_words)
+        Returns:
+            Subjectivity score from 0 (objective) to 1 (subjective)
+        """
+        if not words:
+            return 0.0
 
-        # Combine counts
-        total = subjective_count + opinion_count * 0.5
+        # Subjective words count 1, opinion (positive/negative) words 0.5;
+        # both are folded into one per-word weight summed by map() in C
+        total = sum(map(cls._subjectivity_lookup.get, words, repeat(0.0)))
         return min(total / len(words) * 3, 1.0)  # Scale up and cap at 1
 
     def _calculate_intensity(self, text: str) -> float:
@@ -225,8 +357,20 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         Returns:
             Intensity score from 0 (calm) to 1 (intense)
         """
-        text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
+        return self._intensity_from_words(text, tokenize_words(text.lower()))
+
+    @classmethod
+    def _intensity_from_words(cls, text: str, words: List[str]) -> float:
+        """
+        Calculate emotional intensity from the raw text and its word tokens.
+
+        Args:
+            text: Original (not lowercased) text, for punctuation/caps markers
+            words: Lowercased words of the text
+
+        Returns:
+            Intensity score from 0 (calm) to 1 (intense)
+        """
         if not words:
             return 0.0
 
@@ -234,15 +378,15 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         intensity_count = 0
 
         # Check intensity words
-        intensity_count += sum(1 for w in words if w in self.intensity_words)
+        intensity_count += sum(map(cls.intensity_words.__contains__, words))
 
         # Check punctuation intensity
         intensity_count += text.count('!') * 0.5
         intensity_count += text.count('?') * 0.3
-        intensity_count += len(re.findall(r'[A-Z]{2,}', text)) * 0.5  # ALL CAPS
+        intensity_count += len(_CAPS_RE.findall(text)) * 0.5  # ALL CAPS
 
         # Check elongation (e.g., "sooooo")
-        intensity_count += len(re.findall(r'(.)\1{2,}', text)) * 0.3
+        intensity_count += len(_ELONG_RE.findall(text)) * 0.3
 
         # Normalize
         return min(intensity_count / len(words) * 5, 1.0)
@@ -259,15 +403,24 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         Returns:
             Valence shift score from 0 (consistent) to 1 (high shift)
         """
-        # Split into segments
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        return self._valence_shift_from_sentences(tokenize_sentences(text.lower()))
 
+    @classmethod
+    def _valence_shift_from_sentences(cls, sentences: List[List[str]]) -> float:
+        """
+        Calculate sentiment shift from per-sentence word tokens.
+
+        Args:
+            sentences: Lowercased words of each non-blank sentence
+
+        Returns:
+            Valence shift score from 0 (consistent) to 1 (high shift)
+        """
         if len(sentences) < 2:
             return 0.0
 
         # Calculate polarity for each segment
-        polarities = [self._calculate_polarity(s) for s in sentences]
+        polarities = [cls._sentence_polarity(tuple(words)) for words in sentences]
 
         # Calculate variance/shift
         if len(polarities) >= 2:
@@ -277,8 +430,10 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
                 if polarities[i] * polarities[i-1] < 0
             )
 
-            # Check polarity variance
-            variance = np.var(polarities)
+            # Check polarity variance (plain floats: the list is short, so
+            # np.var's dispatch overhead would dominate)
+            mean = sum(polarities) / len(polarities)
+            variance = sum((p - mean) * (p - mean) for p in polarities) / len(polarities)
 
             # Combine metrics
             shift = (sign_changes / (len(polarities) - 1)) * 0.6 + min(variance * 2, 0.4)
@@ -296,30 +451,129 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
         Returns:
             np.ndarray: Feature vector of shape (4,)
         """
-        try:
-            # Calculate all sentiment features
-            polarity = self._calculate_polarity(text)
-            subjectivity = self._calculate_subjectivity(text)
-            intensity = self._calculate_intensity(text)
-            valence_shift = self._calculate_valence_shift(text)
-
-            # Scale polarity from [-1, 1] to [0, 1] for consistency
-            polarity_scaled = (polarity + 1) / 2
+        # Empty/blank input: neutral vector, no cache lookup
+        if not text or text.isspace():
+            return _NEUTRAL.copy()
 
-            # Build feature vector
-            features = np.array([
-                polarity_scaled,    # 0: polarity (0=negative, 0.5=neutral, 1=positive)
-                subjectivity,       # 1: subjectivity (0=objective, 1=subjective)
-                intensity,          # 2: emotional intensity
-                valence_shift       # 3: sentiment shift
-            ], dtype=np.float32)
-
-            return features
+        try:
+            return np.array(self._extract_cached(text), dtype=np.float32)
 
         except Exception as e:
             logger.error(f"Sentiment features extraction error: {e}")
             return self._get_zero_features()
 
+    def extract_batch(self, texts: List[str], n_jobs: int = 1) -> np.ndarray:
+        """
+        Extract sentiment features from multiple texts.
+
+        Subjectivity and intensity-word counts are computed for the whole
+        batch at once: tokens of all texts are mapped to word ids in one flat
+        array and summed per text with np.bincount. Polarity and valence
+        shift depend on token order (negation/intensifier state), so they
+        are still scored text by text.
+
+        Args:
+            texts: List of input texts
+            n_jobs: Number of worker processes (-1 for all cores)
+
+        Returns:
+            np.ndarray: Feature matrix of shape (n_texts, 4)
+        """
+        if n_jobs != 1 and len(texts) >= self.PARALLEL_MIN_BATCH:
+            return self._extract_batch_parallel(texts, n_jobs)
+
+        n_texts = len(texts)
+        features = np.zeros((n_texts, self.OUTPUT_DIM), dtype=np.float32)
+        word_counts = np.zeros(n_texts)
+        markers = np.zeros((n_texts, 4))  # '!', '?', ALL CAPS runs, elongations
+
+        count_index = self._count_index
+        flat_ids: List[int] = []
+        doc_ids: List[int] = []
+
+        for i, text in enumerate(texts):
+            try:
+                sentences = tokenize_sentences(text.lower())
+                words = list(chain.from_iterable(sentences))
+                if not words:
+                    features[i] = _NEUTRAL
+                    continue
+                polarity = self._polarity_from_words(words)
+                features[i, 3] = self._valence_shift_from_sentences(sentences)
+                features[i, 0] = (polarity + 1) / 2
+                markers[i] = (
+                    text.count('!'), text.count('?'),
+                    len(_CAPS_RE.findall(text)), len(_ELONG_RE.findall(text))
+                )
+            except Exception as e:
+                logger.warning(f"{self.name}: Error extracting features: {e}")
+                features[i] = 0.0
+                markers[i] = 0.0
+                continue
+
+            word_counts[i] = len(words)
+            ids = [count_index[w] for w in words if w in count_index]
+            flat_ids.extend(ids)
+            doc_ids.extend([i] * len(ids))
+
+        subjective_total = np.bincount(
+            doc_ids, weights=self._subjectivity_weights[flat_ids], minlength=n_texts
+        )
+        intensity_count = np.bincount(
+            doc_ids, weights=self._intensity_weights[flat_ids], minlength=n_texts
+        )
+
+        # Same formulas as the per-text calculators (0 for texts without words)
+        has_words = word_counts > 0
+        safe_counts = np.where(has_words, word_counts, 1.0)
+        intensity_count = (
+            intensity_count + markers[:, 0] * 0.5 + markers[:, 1] * 0.3
+            + markers[:, 2] * 0.5 + markers[:, 3] * 0.3
+        )
+        features[:, 1] = np.where(has_words, np.minimum(subjective_total / safe_counts * 3, 1.0), 0.0)
+        features[:, 2] = np.where(has_words, np.minimum(intensity_count / safe_counts * 5, 1.0), 0.0)
+
+        return features
+
+    @classmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _extract_cached(cls, text: str) -> Tuple[float, float, float, float]:
+        """
+        Compute the sentiment feature values for a text, memoized per text.
+
+        Repeated texts (training epochs, cross-validation folds, duplicate
+        messages) skip all four calculators on a cache hit.
+
+        Args:
+            text: Input text string
+
+        Returns:
+            Tuple of (polarity_scaled, subjectivity, intensity, valence_shift)
+        """
+        # Tokenize once and share the words across calculators
+        sentences = tokenize_sentences(text.lower())
+        words = list(chain.from_iterable(sentences))
+
+        # Every calculator scores a text without words as neutral
+        if not words:
+            return _NEUTRAL_VALUES
+
+        # Calculate all sentiment features
+        polarity = cls._polarity_from_words(words)
+        subjectivity = cls._subjectivity_from_words(words)
+        intensity = cls._intensity_from_words(text, words)
+        valence_shift = cls._valence_shift_from_sentences(sentences)
+
+        # Scale polarity from [-1, 1] to [0, 1] for consistency
+        polarity_scaled = (polarity + 1) / 2
+
+        return (
+            polarity_scaled,    # 0: polarity (0=negative, 0.5=neutral, 1=positive)
+            subjectivity,       # 1: subjectivity (0=objective, 1=subjective)
+            intensity,          # 2: emotional intensity
+            valence_shift       # 3: sentiment shift
+        )
+
     def get_detailed_sentiment(self, text: str) -> dict:
         """
         Get detailed sentiment analysis for interpretability.
@@ -348,3 +602,27 @@ class SentimentFeatureExtractor(BaseFeatureExtractor):
             'intensity_score',
             'valence_shift_score'
         ]
+
+
+SentimentFeatureExtractor._build_lexicons()
+
+
+if __name__ == '__main__':
+    # Regression check: worker processes unpickle the extractor without
+    # running __init__, so parallel extraction must match the serial result.
+    # Run with: python -m features.sentiment_features
+    sample = [
+        "I'm NOT happy at all!!", "what a great, wonderful day",
+        "so tired. can't do this anymore...", "meh", "",
+        "really really good but also kinda sad?", "I hate this sooo much",
+    ]
+    texts = [sample[i % len(sample)] + ' ' * (i % 5) for i in range(1200)]
+
+    # Import the class by module name so workers unpickle it from the module,
+    # as they do in normal use, rather than from this __main__ copy
+    from features.sentiment_features import SentimentFeatureExtractor as Extractor
+    extractor = Extractor()
+    serial = extractor.extract_batch(texts)
+    parallel = extractor.extract_batch(texts, n_jobs=2)
+    assert np.array_equal(serial, parallel), "parallel extraction differs from serial"
+    print(f"OK: parallel extraction matches serial on {len(texts)} texts")
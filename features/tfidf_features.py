@@ -10,6 +10,7 @@ FEATURES:
 - Word-level TF-IDF (unigrams + bigrams, 6000 features)
 - Character-level TF-IDF (3-5 char n-grams, 8000 features)
 - Combined: 14000 total features
+- Optional stateless mode: HashingVectorizer instead of fitted vocabularies
 
 REMOVABILITY:
 -------------
@@ -21,17 +22,83 @@ CONFIG FLAG: ENABLE_TFIDF_FEATURES
 """
 
 import numpy as np
+import copy
 import joblib
 import os
 import logging
+from functools import lru_cache
 from typing import List, Optional
-from scipy.sparse import hstack, issparse
-from sklearn.feature_extraction.text import TfidfVectorizer
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import csr_matrix, hstack, vstack
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 
-from .base_feature import BaseFeatureExtractor
+from .base_feature import BaseFeatureExtractor, balanced_chunks
 
 logger = logging.getLogger(__name__)
 
+# Max number of distinct texts whose sparse TF-IDF rows extract() memoizes,
+# per extractor instance
+_EXTRACT_CACHE_SIZE = 10_000
+
+
+def _transform_split(word_vectorizer, char_vectorizer, texts: List[str]):
+    """
+    Transform texts with both vectorizers, returning the two CSR blocks.
+
+    Texts are lowercased here, once, instead of inside each vectorizer
+    (which run with lowercase=False). The two transforms run concurrently
+    on two threads for large batches.
+    """
+    vectorizers = (word_vectorizer, char_vectorizer)
+    texts = [text.lower() for text in texts]
+
+    if len(texts) >= BaseFeatureExtractor.PARALLEL_MIN_BATCH:
+        word_features, char_features = Parallel(n_jobs=2, prefer='threads')(
+            delayed(v.transform)(texts) for v in vectorizers
+        )
+    else:
+        word_features, char_features = (v.transform(texts) for v in vectorizers)
+
+    return word_features, char_features
+
+
+def _transform_texts(word_vectorizer, char_vectorizer, texts: List[str]):
+    """Transform texts with both vectorizers and combine into one CSR matrix."""
+    return hstack(_transform_split(word_vectorizer, char_vectorizer, texts), format='csr')
+
+
+def _transform_batch(word_vectorizer, char_vectorizer, texts: List[str], n_jobs: int = 1):
+    """
+    Transform a batch, in worker processes when n_jobs != 1 and it is large.
+
+    Tokenization inside sklearn is pure Python, so large batches are split
+    into length-balanced chunks spread over processes; rows are restored to
+    the original text order afterwards.
+    """
+    if n_jobs == 1 or len(texts) < BaseFeatureExtractor.PARALLEL_MIN_BATCH:
+        return _transform_texts(word_vectorizer, char_vectorizer, texts)
+
+    n_workers = effective_n_jobs(n_jobs)
+    chunks, restore = balanced_chunks(texts, n_workers)
+    results = Parallel(n_jobs=n_workers)(
+        delayed(_transform_texts)(word_vectorizer, char_vectorizer, chunk)
+        for chunk in chunks
+    )
+    return vstack(results, format='csr')[restore]
+
+
+def _cached_transform_texts(word_fingerprint: str, char_fingerprint: str,
+                            texts: List[str], word_vectorizer, char_vectorizer,
+                            n_jobs: int = 1):
+    """
+    joblib.Memory entry point for _transform_batch().
+
+    The vectorizers themselves are excluded from the cache key; their
+    fingerprints (hash of vocabulary and idf weights) stand in for them, so
+    hashing a call does not re-pickle the full vectorizers.
+    """
+    return _transform_batch(word_vectorizer, char_vectorizer, texts, n_jobs)
+
 
 class TfidfFeatureExtractor(BaseFeatureExtractor):
     """
@@ -53,28 +120,73 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
     def __init__(
         self,
         word_vectorizer_path: Optional[str] = None,
-        char_vectorizer_path: Optional[str] = None
+        char_vectorizer_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_hashing: bool = False
     ):
         """
         Initialize TF-IDF feature extractor.
 
         Args:
-            word_vectorizer_path: Path to fitted word vectorizer (None to create new)
+            word_vectorizer_path: Path to fitted word vectorizer (None to create new).
+                Saved vectorizers are memory-mapped, so keep them on a local disk.
             char_vectorizer_path: Path to fitted char vectorizer (None to create new)
+            cache_dir: Directory for an on-disk cache of extract_batch()
+                results (None to disable). Useful when the same corpus is
+                vectorized repeatedly, e.g. in cross-validation.
+            use_hashing: Use stateless HashingVectorizers (l2-normalized term
+                counts, no idf) instead of fitted TF-IDF vectorizers. Nothing
+                is loaded or fitted, so the extractor is ready at cold start
+                and cheap to fork. Not compatible with models trained on
+                TF-IDF features.
         """
         super().__init__(name='tfidf')
 
         self.word_vectorizer = None
         self.char_vectorizer = None
 
-        # Load pre-trained vectorizers if paths provided
-        if word_vectorizer_path and os.path.exists(word_vectorizer_path):
-            self.word_vectorizer = joblib.load(word_vectorizer_path)
-            logger.info(f"Loaded word vectorizer from {word_vectorizer_path}")
+        # Optional disk cache of batch transforms
+        self._cached_transform = None
+        self._fingerprints = None
+        if cache_dir:
+            memory = joblib.Memory(cache_dir, mmap_mode='r', verbose=0)
+            self._cached_transform = memory.cache(
+                _cached_transform_texts,
+                ignore=['word_vectorizer', 'char_vectorizer', 'n_jobs']
+            )
 
-        if char_vectorizer_path and os.path.exists(char_vectorizer_path):
-            self.char_vectorizer = joblib.load(char_vectorizer_path)
-            logger.info(f"Loaded char vectorizer from {char_vectorizer_path}")
+        self.use_hashing = use_hashing
+        if use_hashing:
+            self.word_vectorizer = HashingVectorizer(
+                analyzer='word',
+                ngram_range=(1, 2),
+                n_features=self.WORD_MAX_FEATURES,
+                stop_words='english',
+                lowercase=False,
+                alternate_sign=False,
+                norm='l2',
+                dtype=np.float32
+            )
+            self.char_vectorizer = HashingVectorizer(
+                analyzer='char_wb',
+                ngram_range=(3, 5),
+                n_features=self.CHAR_MAX_FEATURES,
+                lowercase=False,
+                alternate_sign=False,
+                norm='l2',
+                dtype=np.float32
+            )
+        else:
+            # Load pre-trained vectorizers if paths provided. Numeric arrays
+            # (idf weights) are memory-mapped read-only, so worker processes
+            # share one copy of the pages; compressed files load normally.
+            if word_vectorizer_path and os.path.exists(word_vectorizer_path):
+                self.word_vectorizer = joblib.load(word_vectorizer_path, mmap_mode='r')
+                logger.info(f"Loaded word vectorizer from {word_vectorizer_path}")
+
+            if char_vectorizer_path and os.path.exists(char_vectorizer_path):
+                self.char_vectorizer = joblib.load(char_vectorizer_path, mmap_mode='r')
+                logger.info(f"Loaded char vectorizer from {char_vectorizer_path}")
 
         # Create new vectorizers if not loaded
         if self.word_vectorizer is None:
@@ -83,7 +195,8 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
                 ngram_range=(1, 2),
                 max_features=self.WORD_MAX_FEATURES,
                 stop_words='english',
-                lowercase=True
+                lowercase=False,
+                dtype=np.float32
             )
 
         if self.char_vectorizer is None:
@@ -91,15 +204,24 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
                 analyzer='char_wb',
                 ngram_range=(3, 5),
                 max_features=self.CHAR_MAX_FEATURES,
-                lowercase=True
+                lowercase=False,
+                dtype=np.float32
             )
 
-        # Check if vectorizers are already fitted
-        self._is_fitted = (
+        # Inputs are lowercased once before vectorizing (see _transform_split),
+        # so loaded vectorizers must not lowercase again. Features are float32
+        # throughout: half the memory traffic of float64 for 14000-dim rows.
+        self.word_vectorizer.set_params(lowercase=False, dtype=np.float32)
+        self.char_vectorizer.set_params(lowercase=False, dtype=np.float32)
+
+        # Check if vectorizers are already fitted (hashing needs no fit)
+        self._is_fitted = use_hashing or (
             hasattr(self.word_vectorizer, 'vocabulary_') and
             hasattr(self.char_vectorizer, 'vocabulary_')
         )
 
+        self._reset_transform_cache()
+
     @property
     def output_dim(self) -> int:
         """Return total feature dimension (word + char)."""
@@ -116,10 +238,17 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
         Returns:
             self
         """
+        if self.use_hashing:
+            logger.info("Hashing vectorizers are stateless, nothing to fit")
+            return self
+
         logger.info("Fitting TF-IDF vectorizers...")
+        texts = [text.lower() for text in texts]
         self.word_vectorizer.fit(texts)
         self.char_vectorizer.fit(texts)
         self._is_fitted = True
+        self._fingerprints = None  # Refitted vectorizers invalidate cached batches
+        self._reset_transform_cache()
         logger.info(f"TF-IDF fitted: word vocab={len(self.word_vectorizer.vocabulary_)}, "
                    f"char vocab={len(self.char_vectorizer.vocabulary_)}")
         return self
@@ -132,68 +261,113 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
             text: Input text string
 
         Returns:
-            np.ndarray: Feature vector of shape (output_dim,)
+            np.ndarray: float32 feature vector of shape (output_dim,)
         """
         if not self._is_fitted:
             logger.warning("TF-IDF vectorizers not fitted, returning zeros")
             return self._get_zero_features()
 
         try:
-            # Transform text using both vectorizers
-            word_features = self.word_vectorizer.transform([text])
-            char_features = self.char_vectorizer.transform([text])
-
-            # Combine features
-            combined = hstack([word_features, char_features])
+            # Transform text using both vectorizers (memoized, sparse)
+            combined = self._transform_single(text)
 
             # Convert to dense array
-            if issparse(combined):
-                combined = combined.toarray()
-
-            return combined.flatten()
+            return combined.toarray().ravel()
 
         except Exception as e:
             logger.error(f"TF-IDF extraction error: {e}")
             return self._get_zero_features()
 
-    def extract_batch(self, texts: List[str]) -> np.ndarray:
+    def _transform_text(self, text: str):
+        """Transform one text into a sparse (1, n_features) row."""
+        return _transform_texts(self.word_vectorizer, self.char_vectorizer, [text])
+
+    def _reset_transform_cache(self):
+        """
+        (Re)create this instance's memo of single-text transforms.
+
+        Repeated inputs to extract() skip sklearn tokenization entirely. The
+        sparse row is cached rather than the dense vector to keep the cache
+        small. The memo belongs to the instance, so refitting one extractor
+        leaves others' caches alone and it is freed with the extractor.
+        """
+        self._transform_single = lru_cache(maxsize=_EXTRACT_CACHE_SIZE)(self._transform_text)
+
+    def __getstate__(self):
+        # The memo wraps a bound method and cannot be pickled; it is rebuilt on load
+        state = self.__dict__.copy()
+        state.pop('_transform_single', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_transform_cache()
+
+    def extract_batch(self, texts: List[str], n_jobs: int = 1, dense: bool = False):
         """
         Extract TF-IDF features from multiple texts efficiently.
 
+        The word and char transforms run concurrently on two threads for
+        large batches; with n_jobs != 1, large batches are also split into
+        length-balanced chunks transformed in worker processes. The result
+        stays sparse unless dense=True, so callers only pay for a dense
+        (n_texts, 14000) matrix when they need one.
+
         Args:
             texts: List of input texts
+            n_jobs: Number of worker processes (-1 for all cores)
+            dense: Return a dense array instead of a CSR matrix
 
         Returns:
-            np.ndarray: Feature matrix of shape (n_texts, output_dim)
+            float32 scipy.sparse.csr_matrix (or np.ndarray if dense) of shape (n_texts, output_dim)
         """
         if not self._is_fitted:
             logger.warning("TF-IDF vectorizers not fitted, returning zeros")
-            return np.zeros((len(texts), self.output_dim))
+            return self._zero_batch(len(texts), dense)
 
         try:
             # Batch transform is more efficient
-            word_features = self.word_vectorizer.transform(texts)
-            char_features = self.char_vectorizer.transform(texts)
-
-            # Combine features
-            combined = hstack([word_features, char_features])
-
-            # Convert to dense array
-            if issparse(combined):
-                combined = combined.toarray()
-
+            if self._cached_transform is not None:
+                combined = self._cached_transform(
+                    *self._get_fingerprints(), list(texts),
+                    self.word_vectorizer, self.char_vectorizer, n_jobs
+                )
+            else:
+                combined = _transform_batch(
+                    self.word_vectorizer, self.char_vectorizer, texts, n_jobs
+                )
+
+            if dense:
+                return combined.astype(np.float32, copy=False).toarray()
             return combined
 
         except Exception as e:
             logger.error(f"TF-IDF batch extraction error: {e}")
-            return np.zeros((len(texts), self.output_dim))
+            return self._zero_batch(len(texts), dense)
+
+    def _get_fingerprints(self):
+        """Return (word, char) vectorizer fingerprints used as disk cache keys."""
+        if self._fingerprints is None:
+            self._fingerprints = tuple(
+                joblib.hash(v.get_params()) if self.use_hashing
+                else joblib.hash((v.vocabulary_, v.idf_, v.dtype))
+                for v in (self.word_vectorizer, self.char_vectorizer)
+            )
+        return self._fingerprints
 
-    def extract_sparse(self, texts: List[str]):
+    def _zero_batch(self, n_texts: int, dense: bool):
+        """Return an all-zero batch result in the requested format."""
+        if dense:
+            return np.zeros((n_texts, self.output_dim), dtype=np.float32)
+        return csr_matrix((n_texts, self.output_dim), dtype=np.float32)
+
+    def extract_sparse(self, texts: List[str], n_jobs: int = 1):
         """
         Extract features and keep as sparse matrix (memory efficient).
 
         Args:
             texts: List of input texts
+            n_jobs: Number of worker processes for large batches (-1 for all cores)
 
         Returns:
             scipy.sparse matrix: Sparse feature matrix
@@ -201,14 +375,34 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
         if not self._is_fitted:
             raise ValueError("TF-IDF vectorizers not fitted")
 
-        word_features = self.word_vectorizer.transform(texts)
-        char_features = self.char_vectorizer.transform(texts)
-        return hstack([word_features, char_features])
+        return _transform_batch(self.word_vectorizer, self.char_vectorizer, texts, n_jobs)
+
+    def extract_batch_split(self, texts: List[str]):
+        """
+        Extract word and char features as two separate sparse blocks.
+
+        For consumers that handle the blocks independently (separate linear
+        heads, feature unions); skips building the combined matrix.
+        extract_sparse() returns the same blocks stacked side by side.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Tuple of (word_features, char_features) CSR matrices
+        """
+        if not self._is_fitted:
+            raise ValueError("TF-IDF vectorizers not fitted")
+
+        return _transform_split(self.word_vectorizer, self.char_vectorizer, texts)
 
     def save(self, word_path: str, char_path: str):
         """
         Save fitted vectorizers to disk.
 
+        Saved copies have lowercase=True so they behave the same on raw
+        text for code that loads them directly (inference/predict_emotion.py).
+
         Args:
             word_path: Path for word vectorizer
             char_path: Path for char vectorizer
@@ -216,8 +410,9 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
         if not self._is_fitted:
             raise ValueError("Cannot save unfitted vectorizers")
 
-        joblib.dump(self.word_vectorizer, word_path)
-        joblib.dump(self.char_vectorizer, char_path)
+        for vectorizer, path in ((self.word_vectorizer, word_path),
+                                 (self.char_vectorizer, char_path)):
+            joblib.dump(copy.copy(vectorizer).set_params(lowercase=True), path)
         logger.info(f"Saved TF-IDF vectorizers to {word_path}, {char_path}")
 
     def get_feature_names(self) -> List[str]:
@@ -230,6 +425,10 @@ class TfidfFeatureExtractor(BaseFeatureExtractor):
         if not self._is_fitted:
             return []
 
+        if self.use_hashing:
+            return ([f"word_hash_{i}" for i in range(self.WORD_MAX_FEATURES)] +
+                    [f"char_hash_{i}" for i in range(self.CHAR_MAX_FEATURES)])
+
         word_names = [f"word_{n}" for n in self.word_vectorizer.get_feature_names_out()]
         char_names = [f"char_{n}" for n in self.char_vectorizer.get_feature_names_out()]
         return word_names + char_names
@@ -37,13 +37,17 @@ CONFIG FLAGS:
 
 """
 
+import math
 import numpy as np
 import joblib
+from joblib import Parallel, delayed, effective_n_jobs
 import os
 import logging
 from typing import List, Dict, Optional, Tuple, Any
 from sklearn.linear_model import LogisticRegression
+from sklearn.feature_selection import SelectKBest, f_classif
 from sklearn.base import BaseEstimator, ClassifierMixin
+from scipy.special import expit, softmax
 
 import config
 from features import FeatureManager
@@ -69,11 +73,83 @@ STAGE3_LABELS = {
     'stress': 3
 }
 
+# Stage 3 training labels (distress/strong_distress are mapped to anxiety)
+STAGE3_TRAINING_LABELS = {
+    'anxiety': 0,
+    'distress': 0,
+    'strong_distress': 0,
+    'sadness': 1,
+    'sad': 1,
+    'anger': 2,
+    'angry': 2,
+    'frustration': 2,
+    'stress': 3,
+    'stressed': 3
+}
+
 # Reverse mappings
 STAGE1_REVERSE = {v: k for k, v in STAGE1_LABELS.items()}
 STAGE2_REVERSE = {v: k for k, v in STAGE2_LABELS.items()}
 STAGE3_REVERSE = {v: k for k, v in STAGE3_LABELS.items()}
 
+# Stage 3 labels indexed by class id, for vectorized lookup
+STAGE3_LABEL_ARRAY = np.array(
+    [STAGE3_REVERSE[i] for i in range(len(STAGE3_REVERSE))], dtype=object
+)
+
+
+def _select_rows(X, mask: np.ndarray):
+    """Return the rows of X selected by a boolean mask (X itself if all are)."""
+    return X if mask.all() else X[mask]
+
+
+def _all_stages_enabled() -> bool:
+    """True when all three stages are enabled in config."""
+    return (
+        config.ENABLE_STAGE1_NEUTRAL_EMOTIONAL and
+        config.ENABLE_STAGE2_POSITIVE_NEGATIVE and
+        config.ENABLE_STAGE3_FINE_GRAINED
+    )
+
+
+def _above(p: np.ndarray, threshold: Optional[float]) -> np.ndarray:
+    """Boolean mask of p >= threshold (all True when threshold is None)."""
+    if threshold is None:
+        return np.ones(p.shape[0], dtype=bool)
+    return p >= threshold
+
+
+def _fused_proba_row(decisions: List[float]) -> List[float]:
+    """
+    Class probabilities of one sample from its six fused decision values.
+
+    Scalar version of the batch computation in predict_proba(), for
+    single-message inference where per-call ufunc overhead dominates.
+    """
+    p_emotional = 1.0 / (1.0 + math.exp(-decisions[0]))
+    p_negative_given_emotional = 1.0 / (1.0 + math.exp(-decisions[1]))
+    p_negative = p_emotional * p_negative_given_emotional
+
+    # Softmax over the Stage 3 logits
+    logits = decisions[2:6]
+    top = max(logits)
+    exps = [math.exp(z - top) for z in logits]
+    total = sum(exps)
+
+    return [1 - p_emotional, (1 - p_negative_given_emotional) * p_emotional] + [
+        p_negative * (e / total) for e in exps
+    ]
+
+
+def _weights_by_dtype(W: np.ndarray, b: np.ndarray) -> Dict[np.dtype, Tuple[np.ndarray, np.ndarray]]:
+    """Fused weights keyed by the feature dtype they are used with."""
+    W = np.asarray(W, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    return {
+        np.dtype(np.float64): (W, b),
+        np.dtype(np.float32): (W.astype(np.float32), b.astype(np.float32)),
+    }
+
 
 class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
     """
@@ -90,11 +166,19 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
     Individual stages can also be disabled.
     """
 
+    # Minimum batch size for splitting predictions across threads
+    PARALLEL_MIN_BATCH = 1000
+
     def __init__(
         self,
         stage1_model=None,
         stage2_model=None,
-        stage3_model=None
+        stage3_model=None,
+        emotional_threshold: Optional[float] = None,
+        negative_threshold: Optional[float] = None,
+        n_jobs: Optional[int] = None,
+        exit_threshold: Optional[float] = None,
+        exit_n_features: int = 32
     ):
         """
         Initialize HierarchicalClassifier.
@@ -103,6 +187,19 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
             stage1_model: Model for neutral/emotional classification
             stage2_model: Model for positive/negative classification
             stage3_model: Model for fine-grained emotion classification
+            emotional_threshold: In predict_proba(), skip Stages 2-3 for samples
+                with P(emotional) below this and split their emotional mass
+                evenly, as if those stages were disabled (None = always run)
+            negative_threshold: In predict_proba(), skip Stage 3 for samples
+                with P(negative) below this and split it evenly over the
+                fine-grained classes (None = always run)
+            n_jobs: Threads for predict()/predict_proba() on large batches,
+                each handling a contiguous block of rows (None or 1 = one call)
+            exit_threshold: Train a small exit predictor (logistic regression
+                on the exit_n_features most informative columns) next to
+                Stage 1; samples it scores below this P(emotional) are
+                returned as neutral without running the stages (None = off)
+            exit_n_features: Number of columns the exit predictor uses
         """
         # Initialize models (use LogisticRegression by default)
         self.stage1_model = stage1_model or LogisticRegression(
@@ -121,48 +218,39 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
             n_jobs=-1
         )
 
+        self.emotional_threshold = emotional_threshold
+        self.negative_threshold = negative_threshold
+        self.n_jobs = n_jobs
+        self.exit_threshold = exit_threshold
+        self.exit_n_features = exit_n_features
+
+        self.exit_predictor = None
+        self._exit_cols = None
+
+        self._fused_weights = None
         self._is_fitted = False
+        self._inference_only = False  # only fused weights, from load_inference()
         self.classes_ = np.array(['neutral', 'positive', 'anxiety', 'sadness', 'anger', 'stress'])
 
     def _map_to_stage1(self, labels: np.ndarray) -> np.ndarray:
         """Map original labels to stage 1 (neutral vs emotional)."""
-        mapped = []
-        for label in labels:
-            if label == 'neutral':
-                mapped.append(0)  # neutral
-            else:
-                mapped.append(1)  # emotional
-        return np.array(mapped)
+        # 0 = neutral, 1 = emotional
+        return (np.asarray(labels) != 'neutral').astype(np.int64)
 
     def _map_to_stage2(self, labels: np.ndarray) -> np.ndarray:
         """Map original labels to stage 2 (positive vs negative)."""
-        mapped = []
-        for label in labels:
-            if label == 'positive':
-                mapped.append(0)  # positive
-            else:
-                mapped.append(1)  # negative
-        return np.array(mapped)
+        # 0 = positive, 1 = negative
+        return (np.asarray(labels) != 'positive').astype(np.int64)
 
     def _map_to_stage3(self, labels: np.ndarray) -> np.ndarray:
         """Map original labels to stage 3 (fine-grained)."""
-        # Map distress/strong_distress to anxiety for training
-        label_map = {
-            'anxiety': 0,
-            'distress': 0,
-            'strong_distress': 0,
-            'sadness': 1,
-            'sad': 1,
-            'anger': 2,
-            'angry': 2,
-            'frustration': 2,
-            'stress': 3,
-            'stressed': 3
-        }
-        mapped = []
-        for label in labels:
-            mapped.append(label_map.get(label, 0))  # Default to anxiety
-        return np.array(mapped)
+        # Look up each distinct label once, then expand by inverse index
+        distinct, inverse = np.unique(np.asarray(labels), return_inverse=True)
+        codes = np.array(
+            [STAGE3_TRAINING_LABELS.get(label, 0) for label in distinct],  # Default to anxiety
+            dtype=np.int64
+        )
+        return codes[inverse.ravel()]
 
     def fit(self, X: np.ndarray, y: np.ndarray):
         """
@@ -184,6 +272,9 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
                        f"(neutral={sum(y_stage1==0)}, emotional={sum(y_stage1==1)})")
             self.stage1_model.fit(X, y_stage1)
 
+            if self.exit_threshold is not None:
+                self._fit_exit_predictor(X, y_stage1)
+
         # Stage 2: Positive vs Negative (only emotional samples)
         if config.ENABLE_STAGE2_POSITIVE_NEGATIVE:
             emotional_mask = (y != 'neutral')
@@ -203,66 +294,190 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
             logger.info(f"Stage 3: Training on {len(y_negative)} negative samples")
             self.stage3_model.fit(X_negative, y_stage3)
 
+        self._fused_weights = self._stack_stage_weights()
         self._is_fitted = True
+        self._inference_only = False
         return self
 
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def _fit_exit_predictor(self, X, y_stage1: np.ndarray):
         """
-        Predict emotion labels using hierarchical classification.
+        Fit the early-exit probe on the most informative Stage 1 columns.
 
         Args:
             X: Feature matrix
+            y_stage1: Stage 1 labels (0 = neutral, 1 = emotional)
+        """
+        k = min(self.exit_n_features, X.shape[1])
+        selector = SelectKBest(f_classif, k=k).fit(X, y_stage1)
+        self._exit_cols = selector.get_support(indices=True)
+        self.exit_predictor = LogisticRegression(max_iter=1000, class_weight='balanced')
+        self.exit_predictor.fit(X[:, self._exit_cols], y_stage1)
+        logger.info(f"Exit predictor: trained on {k} columns")
+
+    def _exit_scores(self, X) -> Optional[np.ndarray]:
+        """
+        P(emotional) from the exit predictor, or None if early exit is off.
+        """
+        if (self.exit_threshold is None or self.exit_predictor is None
+                or not config.ENABLE_STAGE1_NEUTRAL_EMOTIONAL):
+            return None
+        return self.exit_predictor.predict_proba(X[:, self._exit_cols])[:, 1]
+
+    def _stack_stage_weights(self) -> Optional[Dict[np.dtype, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Stack the three stage models' linear weights for one fused matmul.
+
+        Only possible when every stage is a fitted LogisticRegression with the
+        expected classes (binary Stages 1-2, four-class softmax Stage 3).
 
         Returns:
-            Array of predicted labels
+            {dtype: (W, b)} for float64 and float32, with W of shape
+            (n_features, 6) and b of shape (6,): columns 0-1 are the Stage 1/2
+            decision values, 2-5 the Stage 3 logits. None if the stages
+            cannot be fused.
         """
-        if not self._is_fitted:
-            raise ValueError("Classifier not fitted. Call fit() first.")
+        models = (self.stage1_model, self.stage2_model, self.stage3_model)
+        expected_classes = ([0, 1], [0, 1], [0, 1, 2, 3])
+        for model, classes in zip(models, expected_classes):
+            if not (isinstance(model, LogisticRegression) and hasattr(model, 'coef_')):
+                return None
+            if not np.array_equal(model.classes_, classes):
+                return None
+
+        # Stage 3 must use softmax (multinomial), not one-vs-rest
+        stage3 = self.stage3_model
+        if stage3.solver == 'liblinear' or getattr(stage3, 'multi_class', 'auto') == 'ovr':
+            return None
+
+        W = np.hstack([model.coef_.T for model in models])
+        b = np.concatenate([model.intercept_ for model in models])
+        return _weights_by_dtype(W, b)
+
+    def _fused_decisions(self, X) -> Optional[np.ndarray]:
+        """
+        Decision values of all three stages from a single X @ W product.
 
-        predictions = []
+        float32 features (what FeatureManager produces) are multiplied with
+        float32 weights, so X is neither upcast nor copied and the product
+        runs in single precision; other input uses the float64 weights.
 
-        for i in range(X.shape[0]):
-            x = X[i:i+1]
-            pred = self._predict_single(x)
-            predictions.append(pred)
+        Returns:
+            (n_samples, 6) array (see _stack_stage_weights), or None when the
+            stages are not fused or not all of them are enabled
+        """
+        if self._fused_weights is None or not _all_stages_enabled():
+            return None
 
-        return np.array(predictions)
+        W, b = self._fused_weights.get(X.dtype, self._fused_weights[np.dtype(np.float64)])
+        return np.asarray(X @ W) + b
 
-    def _predict_single(self, x: np.ndarray) -> str:
+    def _check_can_predict(self):
         """
-        Predict single sample through hierarchy.
+        Raise ValueError if the classifier cannot predict.
+
+        A classifier restored with load_inference() has no stage models, only
+        the fused weights, so it needs all three stages enabled.
+        """
+        if not self._is_fitted:
+            raise ValueError("Classifier not fitted. Call fit() first.")
+        if self._inference_only and not _all_stages_enabled():
+            raise ValueError(
+                "Classifier was loaded with load_inference() and has only the fused "
+                "stage weights, which need all three stages enabled. Enable them "
+                "or load the stage models with load()."
+            )
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict emotion labels using hierarchical classification.
+
+        Each enabled stage model is applied in one call to the samples no
+        earlier stage has decided; a sample takes the label of the first
+        stage that decides it.
 
         Args:
-            x: Single sample feature vector (1, n_features)
+            X: Feature matrix
 
         Returns:
-            Predicted emotion label
+            Array of predicted labels
+        """
+        self._check_can_predict()
+
+        n_samples = X.shape[0]
+        if n_samples == 0:
+            return np.array([])
+
+        return self._run_blocks(self._predict_block, X).astype(str)
+
+    def _predict_block(self, X) -> np.ndarray:
+        """Predict labels (object array) for a block of samples."""
+        # Samples the exit predictor is confident about are neutral
+        exit_scores = self._exit_scores(X)
+        if exit_scores is not None:
+            exited = exit_scores < self.exit_threshold
+            if exited.any():
+                predictions = np.full(X.shape[0], 'neutral', dtype=object)
+                if not exited.all():
+                    predictions[~exited] = self._predict_stages(X[~exited])
+                return predictions
+
+        return self._predict_stages(X)
+
+    def _predict_stages(self, X, decisions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Predict labels (object array) by running the stage models.
+
+        decisions, if given, are X's fused decision values (already computed
+        by the caller), otherwise they are computed here when available.
         """
+        n_samples = X.shape[0]
+
+        # Fallback label if stages are disabled
+        predictions = np.full(n_samples, 'distress', dtype=object)
+        undecided = np.ones(n_samples, dtype=bool)
+
+        # All stages fused into one matmul: same decision rule as each
+        # model's predict() (positive class if decision > 0, else argmax)
+        if decisions is None:
+            decisions = self._fused_decisions(X)
+        if decisions is not None:
+            neutral = decisions[:, 0] <= 0
+            positive = ~neutral & (decisions[:, 1] <= 0)
+            undecided = ~neutral & ~positive
+            predictions[neutral] = 'neutral'
+            predictions[positive] = 'positive'
+            stage3_pred = decisions[undecided, 2:6].argmax(axis=1)
+            predictions[undecided] = STAGE3_LABEL_ARRAY[stage3_pred]
+            return predictions
+
         # Stage 1: Neutral vs Emotional
         if config.ENABLE_STAGE1_NEUTRAL_EMOTIONAL:
-            stage1_pred = self.stage1_model.predict(x)[0]
-            if stage1_pred == 0:  # Neutral
-                return 'neutral'
+            neutral = self.stage1_model.predict(X) == 0
+            predictions[neutral] = 'neutral'
+            undecided &= ~neutral
 
         # Stage 2: Positive vs Negative
-        if config.ENABLE_STAGE2_POSITIVE_NEGATIVE:
-            stage2_pred = self.stage2_model.predict(x)[0]
-            if stage2_pred == 0:  # Positive
-                return 'positive'
+        if config.ENABLE_STAGE2_POSITIVE_NEGATIVE and undecided.any():
+            rows = np.flatnonzero(undecided)
+            positive = rows[self.stage2_model.predict(_select_rows(X, undecided)) == 0]
+            predictions[positive] = 'positive'
+            undecided[positive] = False
 
         # Stage 3: Fine-grained emotion
-        if config.ENABLE_STAGE3_FINE_GRAINED:
-            stage3_pred = self.stage3_model.predict(x)[0]
-            return STAGE3_REVERSE.get(stage3_pred, 'anxiety')
+        if config.ENABLE_STAGE3_FINE_GRAINED and undecided.any():
+            stage3_pred = self.stage3_model.predict(_select_rows(X, undecided))
+            # Stage 3 is trained on _map_to_stage3 codes, all within 0-3
+            predictions[undecided] = STAGE3_LABEL_ARRAY[stage3_pred.astype(np.intp)]
 
-        # Fallback if stages are disabled
-        return 'distress'
+        return predictions
 
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         """
         Predict probabilities for all classes.
 
-        Combines probabilities from all stages.
+        Combines probabilities from all stages, each applied in one call to
+        the samples it runs for (all of them unless emotional_threshold /
+        negative_threshold are set).
 
         Args:
             X: Feature matrix
@@ -270,66 +485,163 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
         Returns:
             Probability matrix (n_samples, n_classes)
         """
-        if not self._is_fitted:
-            raise ValueError("Classifier not fitted. Call fit() first.")
+        self._check_can_predict()
+
+        if X.shape[0] == 0:
+            return np.zeros((0, 6))
+
+        return self._run_blocks(self._predict_proba_block, X)
+
+    def _predict_proba_block(self, X) -> np.ndarray:
+        """Predict class probabilities for a block of samples."""
+        # Exited samples take P(neutral) from the exit predictor and split
+        # the emotional mass evenly, as for disabled stages
+        exit_scores = self._exit_scores(X)
+        if exit_scores is not None:
+            exited = exit_scores < self.exit_threshold
+            if exited.any():
+                p_emotional = exit_scores[exited]
+                proba = np.empty((X.shape[0], 6))
+                proba[exited, 0] = 1 - p_emotional
+                proba[exited, 1] = p_emotional * 0.5
+                proba[exited, 2:6] = (p_emotional * 0.125)[:, None]
+                if not exited.all():
+                    proba[~exited] = self._predict_proba_stages(X[~exited])
+                return proba
+
+        return self._predict_proba_stages(X)
+
+    def _predict_proba_stages(self, X, decisions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Predict class probabilities by running the stage models.
 
+        decisions as for _predict_stages().
+        """
         n_samples = X.shape[0]
         # Classes: neutral, positive, anxiety, sadness, anger, stress
-        proba = np.zeros((n_samples, 6))
+        # Every column is written below, so no zero-fill is needed
+        proba = np.empty((n_samples, 6))
+
+        # All stages fused into one matmul, with each model's own link
+        # function (logistic for Stages 1-2, softmax for Stage 3)
+        if decisions is None:
+            decisions = self._fused_decisions(X)
+        if self.emotional_threshold is None and self.negative_threshold is None:
+            if decisions is not None and n_samples == 1:
+                proba[0] = _fused_proba_row(decisions[0].tolist())
+                return proba
+            if decisions is not None:
+                p_emotional = expit(decisions[:, 0])
+                p_negative_given_emotional = expit(decisions[:, 1])
+                p_negative = p_emotional * p_negative_given_emotional
+                np.subtract(1, p_emotional, out=proba[:, 0])
+                np.subtract(1, p_negative_given_emotional, out=proba[:, 1])
+                proba[:, 1] *= p_emotional
+                np.multiply(p_negative[:, None], softmax(decisions[:, 2:6], axis=1), out=proba[:, 2:6])
+                return proba
+
+        # With thresholds, the fused decisions (if any) still replace the
+        # per-stage predict_proba calls on the selected rows
+
+        # Stage 1: P(neutral) vs P(emotional)
+        if decisions is not None:
+            p_emotional = expit(decisions[:, 0])
+            p_neutral = 1 - p_emotional
+        elif config.ENABLE_STAGE1_NEUTRAL_EMOTIONAL:
+            s1_proba = self.stage1_model.predict_proba(X)
+            p_neutral = s1_proba[:, 0]
+            p_emotional = s1_proba[:, 1]
+        else:
+            p_neutral = 0.0
+            p_emotional = np.ones(n_samples)
+
+        proba[:, 0] = p_neutral
+
+        # Stage 2: P(positive|emotional) vs P(negative|emotional)
+        # Samples below emotional_threshold keep the even split
+        p_positive = p_emotional * 0.5
+        p_negative = p_emotional * 0.5
+        run_stage2 = _above(p_emotional, self.emotional_threshold)
+        if config.ENABLE_STAGE2_POSITIVE_NEGATIVE and run_stage2.any():
+            if decisions is not None:
+                s2_negative = expit(decisions[run_stage2, 1])
+                s2_positive = 1 - s2_negative
+            else:
+                s2_proba = self.stage2_model.predict_proba(_select_rows(X, run_stage2))
+                s2_positive, s2_negative = s2_proba[:, 0], s2_proba[:, 1]
+            p_positive[run_stage2] = p_emotional[run_stage2] * s2_positive
+            p_negative[run_stage2] = p_emotional[run_stage2] * s2_negative
+
+        proba[:, 1] = p_positive
 
-        for i in range(n_samples):
-            x = X[i:i+1]
-            proba[i] = self._predict_proba_single(x)
+        # Stage 3: P(fine_grained|negative)
+        # Columns 2-5: anxiety, sadness, anger, stress
+        # Distribute evenly unless Stage 3 runs for the sample
+        np.divide(p_negative[:, None], 4, out=proba[:, 2:6])
+        run_stage3 = run_stage2 & _above(p_negative, self.negative_threshold)
+        if config.ENABLE_STAGE3_FINE_GRAINED and run_stage3.any():
+            if decisions is not None:
+                s3_proba = softmax(decisions[run_stage3, 2:6], axis=1)
+            else:
+                s3_proba = self.stage3_model.predict_proba(_select_rows(X, run_stage3))
+            proba[run_stage3, 2:6] = p_negative[run_stage3, None] * s3_proba[:, :4]
 
         return proba
 
-    def _predict_proba_single(self, x: np.ndarray) -> np.ndarray:
+    def predict_with_proba(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Predict probabilities for single sample through hierarchy.
+        Predict labels and class probabilities together.
+
+        Same result as (predict(X), predict_proba(X)), but the fused stage
+        product is computed once and shared by both.
 
         Args:
-            x: Single sample feature vector (1, n_features)
+            X: Feature matrix
 
         Returns:
-            Probability array for 6 classes
+            Tuple of (predicted labels, probability matrix)
         """
-        proba = np.zeros(6)
-        # Index: 0=neutral, 1=positive, 2=anxiety, 3=sadness, 4=anger, 5=stress
+        self._check_can_predict()
 
-        # Stage 1: P(neutral) vs P(emotional)
-        if config.ENABLE_STAGE1_NEUTRAL_EMOTIONAL:
-            s1_proba = self.stage1_model.predict_proba(x)[0]
-            p_neutral = s1_proba[0]
-            p_emotional = s1_proba[1]
-        else:
-            p_neutral = 0.0
-            p_emotional = 1.0
+        if X.shape[0] == 0:
+            return np.array([]), np.zeros((0, 6))
 
-        proba[0] = p_neutral
+        labels, proba = self._run_blocks(self._predict_with_proba_block, X)
+        return labels.astype(str), proba
 
-        # Stage 2: P(positive|emotional) vs P(negative|emotional)
-        if config.ENABLE_STAGE2_POSITIVE_NEGATIVE:
-            s2_proba = self.stage2_model.predict_proba(x)[0]
-            p_positive = p_emotional * s2_proba[0]
-            p_negative = p_emotional * s2_proba[1]
-        else:
-            p_positive = p_emotional * 0.5
-            p_negative = p_emotional * 0.5
+    def _predict_with_proba_block(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict labels and class probabilities for a block of samples."""
+        # Early exit splits the block differently for each output, so let
+        # the separate paths handle it
+        exit_scores = self._exit_scores(X)
+        if exit_scores is not None and (exit_scores < self.exit_threshold).any():
+            return self._predict_block(X), self._predict_proba_block(X)
 
-        proba[1] = p_positive
+        decisions = self._fused_decisions(X)
+        return self._predict_stages(X, decisions), self._predict_proba_stages(X, decisions)
 
-        # Stage 3: P(fine_grained|negative)
-        if config.ENABLE_STAGE3_FINE_GRAINED:
-            s3_proba = self.stage3_model.predict_proba(x)[0]
-            proba[2] = p_negative * s3_proba[0]  # anxiety
-            proba[3] = p_negative * s3_proba[1]  # sadness
-            proba[4] = p_negative * s3_proba[2]  # anger
-            proba[5] = p_negative * s3_proba[3]  # stress
-        else:
-            # Distribute evenly
-            proba[2:6] = p_negative / 4
+    def _run_blocks(self, predict_block, X):
+        """
+        Apply predict_block to X, split into row blocks on threads if n_jobs != 1.
 
-        return proba
+        The stage models' matrix products run in BLAS/NumPy code that
+        releases the GIL, so blocks proceed concurrently on threads without
+        copying the model or X into worker processes. If predict_block
+        returns a tuple of arrays, each element is concatenated separately.
+        """
+        n_samples = X.shape[0]
+        if self.n_jobs in (None, 1) or n_samples < self.PARALLEL_MIN_BATCH:
+            return predict_block(X)
+
+        n_blocks = min(effective_n_jobs(self.n_jobs), n_samples)
+        bounds = np.linspace(0, n_samples, n_blocks + 1, dtype=int)
+        results = Parallel(n_jobs=n_blocks, prefer='threads')(
+            delayed(predict_block)(X[start:end])
+            for start, end in zip(bounds[:-1], bounds[1:])
+        )
+        if isinstance(results[0], tuple):
+            return tuple(np.concatenate(parts) for parts in zip(*results))
+        return np.concatenate(results)
 
     def save(self, base_path: str):
         """
@@ -346,6 +658,8 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
             joblib.dump(self.stage2_model, os.path.join(base_path, 'stage2_positive_negative.pkl'))
         if config.ENABLE_STAGE3_FINE_GRAINED:
             joblib.dump(self.stage3_model, os.path.join(base_path, 'stage3_fine_grained.pkl'))
+        if self.exit_predictor is not None:
+            joblib.dump((self.exit_predictor, self._exit_cols), os.path.join(base_path, 'exit_predictor.pkl'))
 
         logger.info(f"Saved hierarchical models to {base_path}")
 
@@ -359,6 +673,7 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
         s1_path = os.path.join(base_path, 'stage1_neutral_emotional.pkl')
         s2_path = os.path.join(base_path, 'stage2_positive_negative.pkl')
         s3_path = os.path.join(base_path, 'stage3_fine_grained.pkl')
+        exit_path = os.path.join(base_path, 'exit_predictor.pkl')
 
         if os.path.exists(s1_path):
             self.stage1_model = joblib.load(s1_path)
@@ -366,10 +681,53 @@ class HierarchicalClassifier(BaseEstimator, ClassifierMixin):
             self.stage2_model = joblib.load(s2_path)
         if os.path.exists(s3_path):
             self.stage3_model = joblib.load(s3_path)
+        if os.path.exists(exit_path):
+            self.exit_predictor, self._exit_cols = joblib.load(exit_path)
 
+        self._fused_weights = self._stack_stage_weights()
         self._is_fitted = True
+        self._inference_only = False
         logger.info(f"Loaded hierarchical models from {base_path}")
 
+    def save_inference(self, path: str):
+        """
+        Save only the fused stage weights as one .npz file.
+
+        Much smaller and faster to load than the stage pickles, but a
+        classifier loaded from it predicts through the fused weights only:
+        all three stages must be enabled and there is no early exit.
+
+        Args:
+            path: Output .npz file
+        """
+        if self._fused_weights is None:
+            raise ValueError("Stage models cannot be fused; use save() instead.")
+
+        W, b = self._fused_weights[np.dtype(np.float64)]
+        np.savez(path, W=W, b=b, classes=self.classes_)
+        logger.info(f"Saved hierarchical inference weights to {path}")
+
+    def load_inference(self, path: str):
+        """
+        Load fused stage weights written by save_inference().
+
+        The stage models are not restored, so predicting requires all
+        three stages to be enabled (see save_inference()).
+
+        Args:
+            path: .npz file from save_inference()
+        """
+        with np.load(path) as npz:
+            W, b, classes = npz['W'], npz['b'], npz['classes']
+
+        self._fused_weights = _weights_by_dtype(W, b)
+        self.classes_ = classes
+        self.exit_predictor = None
+        self._exit_cols = None
+        self._is_fitted = True
+        self._inference_only = True
+        logger.info(f"Loaded hierarchical inference weights from {path}")
+
 
 def create_hierarchical_classifier() -> Optional[HierarchicalClassifier]:
     """
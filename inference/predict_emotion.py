@@ -1,6 +1,13 @@
 import re
+import threading
 import joblib
-from scipy.sparse import hstack
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List
+import numpy as np
+from scipy.sparse import csr_matrix, hstack
 from nltk.stem import WordNetLemmatizer
 from preprocessing.preprocess_text import preprocess_text
 from preprocessing.typo_handler import normalize_text_with_typo_fix
@@ -9,17 +16,43 @@ from preprocessing.typo_handler import normalize_text_with_typo_fix
 # INIT
 # ======================================================
 
-lemmatizer = WordNetLemmatizer()
+# The lemmatizer is built on first use and each word's lemma is memoized;
+# token frequencies are heavily skewed, so most lookups skip WordNet
 
-model = joblib.load("models/emotion_model.pkl")
-word_vec = joblib.load("models/tfidf_word.pkl")
-char_vec = joblib.load("models/tfidf_char.pkl")
+
+@lru_cache(maxsize=1)
+def _lemmatizer():
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=65536)
+def lemmatize(word: str) -> str:
+    return _lemmatizer().lemmatize(word)
+
+
+# Models load on first prediction, not at import; numeric arrays are
+# memory-mapped read-only so worker processes share the pages
+
+
+@lru_cache(maxsize=1)
+def _model():
+    return joblib.load("models/emotion_model.pkl", mmap_mode="r")
+
+
+@lru_cache(maxsize=1)
+def _word_vec():
+    return joblib.load("models/tfidf_word.pkl", mmap_mode="r")
+
+
+@lru_cache(maxsize=1)
+def _char_vec():
+    return joblib.load("models/tfidf_char.pkl", mmap_mode="r")
 
 # ======================================================
 # WORD BANKS (BASE WORDS ONLY)
 # ======================================================
 
-POSITIVE = {
+POSITIVE = frozenset({
     "happy", "excited", "proud", "relieved", "grateful",
     "love", "loved", "loving",
     "good", "great", "amazing", "awesome",
@@ -110,24 +143,24 @@ POSITIVE = {
     "onsite", "opportunity", "new role", "dream job",
     "wfh", "work from home", "remote", "flexible",
     "good team", "supportive manager", "great colleagues"
-}
+})
 
 # ======================================================
 # CURSE WORDS THAT CAN BE POSITIVE OR NEGATIVE
 # (context-dependent - not in ANGER by default)
 # ======================================================
 
-CONTEXT_CURSES = {
+CONTEXT_CURSES = frozenset({
     "fuck", "fucking", "fucked", "fucks", "fck", "fuk", "fuq",
     "shit", "shitty", "shits", "sht", "shyt",
     "damn", "damnn", "damnnn", "dammit", "damnit",
     "hell", "crap", "crappy", "ass", "arse",
     "bitch", "bitches", "bitchin", "biatch", "bytch",
     "wtf", "wth", "omfg", "lmfao", "stfu", "gtfo", "ffs"
-}
+})
 
 # phrases that make curses POSITIVE
-POSITIVE_CURSE_CONTEXT = {
+POSITIVE_CURSE_CONTEXT = frozenset({
     "holy shit", "holy crap", "holy fuck", "holy hell",
     "no fucking way", "fucking amazing", "fucking awesome",
     "fucking incredible", "fucking beautiful", "fucking love",
@@ -150,17 +183,17 @@ POSITIVE_CURSE_CONTEXT = {
     "lets go", "lets goo", "lets gooo", "lessgo",
     "hell of a", "damn it worked", "shit yes",
     "fucking works", "it fucking works", "shit it works"
-}
+})
 
 # words that indicate POSITIVE emotion (override distress if present with these)
-POSITIVE_INDICATORS = {
+POSITIVE_INDICATORS = frozenset({
     "happy", "excited", "yay", "yayy", "yayyy", "yess", "yesss",
     "amazing", "awesome", "great", "good", "love", "loved",
     "finally", "worked", "works", "success", "won", "win",
     "proud", "glad", "thrilled", "pumped", "hyped", "stoked"
-}
+})
 
-SAD = {
+SAD = frozenset({
     "sad", "down", "empty", "lonely", "numb",
     "hopeless", "cry", "hurt", "heartbreak",
     "hate", "disappointment", "broke",
@@ -183,9 +216,9 @@ SAD = {
     "heartbroken", "shattered", "crushed", "devastated",
     "destroyed", "ruined", "broken", "torn",
     "ache", "aching", "sorrow", "sorrowful", "miserable",
-    "pain", "painful", "agony", "suffering", "torment",
+    "pain", "agony", "suffering", "torment",
     "anguish", "distress", "trauma", "traumatic", "scarred",
-    "wounded", "bleeding", "raw", "numb", "paralyzed",
+    "wounded", "bleeding", "raw", "paralyzed",
 
     # 😢 loneliness / isolation
     "alone", "isolated", "disconnected", "unwanted",
@@ -194,16 +227,16 @@ SAD = {
     # 😢 work / office - sad
     "fired", "terminated", "laid off", "layoff", "let go",
     "lost my job", "jobless", "unemployed", "no job",
-    "rejected", "didnt get the job", "failed interview",
+    "didnt get the job", "failed interview",
     "passed over", "not selected", "didnt make it",
     "demoted", "demotion", "pay cut", "salary cut",
     "no appraisal", "bad review", "negative feedback",
     "pip", "performance improvement", "warning letter",
     "left out of project", "removed from team",
     "no recognition", "unappreciated", "taken for granted","quit","quitting","overwhelmed"
-}
+})
 
-DISTRESS = {
+DISTRESS = frozenset({
     "tired", "exhaust", "burn", "overwhelm",
     "drain", "stress", "stressed", "stressing", "stressful",
     "anxious", "panic", "pressure", "frustrate", "stuck",
@@ -246,7 +279,7 @@ DISTRESS = {
     "feeling terrible", "feeling awful", "health issues",
 
     # 😰 work / office - distress
-    "workload", "too much work", "overloaded", "swamped with work",
+    "workload", "too much work", "swamped with work",
     "deadlines", "deadline pressure", "tight deadline",
     "overtime", "working late", "no work life balance",
     "toxic workplace", "toxic boss", "toxic manager",
@@ -258,9 +291,9 @@ DISTRESS = {
     "no growth", "stagnant", "stuck in same role",
     "hate my job", "hate going to work", "dread mondays",
     "sunday scaries", "monday blues"
-}
+})
 
-ANGER = {
+ANGER = frozenset({
     "angry", "mad", "furious",
     "hate", "hated", "hating",
     "resent", "annoy", "irritate",
@@ -332,10 +365,10 @@ ANGER = {
     "toxic coworker", "backstabbing colleague",
     "passed over for promotion", "deserved that promotion",
     "overworked underpaid", "exploited", "taken advantage of"
-}
+})
 
 # phrases that MUST override ML
-EXHAUSTION_PHRASES = {
+EXHAUSTION_PHRASES = frozenset({
     # 🔴 general exhaustion
     "tired of everything",
     "so tired of everything",
@@ -564,7 +597,6 @@ EXHAUSTION_PHRASES = {
     "my head is a mess",
     "mind is a mess",
     "cant cope",
-    "cant handle this",
     "cant handle it",
     "cant deal with this",
     "cant take it anymore",
@@ -596,15 +628,14 @@ EXHAUSTION_PHRASES = {
     "no point anymore",
     "dont see the point",
     "losing hope",
-    "lost all hope",
     "no hope left"
-}
+})
 
 # ======================================================
 # ABBREVIATIONS / SHORT FORMS
 # ======================================================
 
-ABBREVIATIONS = {
+_ABBREVIATIONS = {
     # common text abbreviations
     "u": "you",
     "ur": "your",
@@ -721,7 +752,6 @@ ABBREVIATIONS = {
     "obvi": "obviously",
     "esp": "especially",
     "v": "very",
-    "rn": "right now",
     "atm": "at the moment",
     "asap": "as soon as possible",
 
@@ -804,7 +834,6 @@ ABBREVIATIONS = {
     "nop": "no",
     "na": "no",
     "ofc": "of course",
-    "obv": "obviously",
     "ig": "i guess",
     "igs": "i guess so",
 
@@ -828,7 +857,6 @@ ABBREVIATIONS = {
     "ystrdy": "yesterday",
     "l8r": "later",
     "l8": "late",
-    "2nite": "tonight",
 
     # people
     "bf": "boyfriend",
@@ -900,7 +928,6 @@ ABBREVIATIONS = {
 
     # work / professional
     "mgr": "manager",
-    "hr": "human resources",
     "ceo": "chief executive officer",
     "cto": "chief technology officer",
     "cfo": "chief financial officer",
@@ -909,7 +936,6 @@ ABBREVIATIONS = {
     "govt": "government",
     "proj": "project",
     "mtg": "meeting",
-    "pls": "please",
     "rgds": "regards",
     "fwd": "forward",
     "re": "regarding",
@@ -946,7 +972,6 @@ ABBREVIATIONS = {
     "pics": "pictures",
     "vid": "video",
     "vids": "videos",
-    "diff": "different",
     "diff": "difference",
     "prb": "problem",
     "prblm": "problem",
@@ -983,7 +1008,6 @@ ABBREVIATIONS = {
     "mke": "make",
     "tk": "take",
     "tke": "take",
-    "gt": "get",
     "gt": "got",
     "gd": "good",
     "bd": "bad",
@@ -1005,49 +1029,97 @@ ABBREVIATIONS = {
     "evn": "even",
     "alws": "always",
     "neva": "never",
-    "nvr": "never",
-    "mayb": "maybe",
     "prbly": "probably",
     "cpl": "couple",
     "fav": "favorite",
     "favs": "favorites"
 }
 
-def expand_abbreviations(text: str) -> str:
+# read-only public view; lookups below use the dict itself, which skips
+# the proxy indirection on every token
+ABBREVIATIONS = MappingProxyType(_ABBREVIATIONS)
+
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+def _build_abbreviation_trie(abbreviations) -> dict:
     """
-    Expand common text abbreviations to their full forms.
-    E.g., "idk y u r sad rn" → "i dont know why you are sad right now"
+    Token-level trie of the multi-word abbreviation keys ("fr fr" ...).
+    Nested dicts keyed by word; the None key holds the full abbreviation.
     """
-    words = text.lower().split()
+    trie = {}
+    for key in abbreviations:
+        words = key.split()
+        if len(words) < 2:
+            continue
+        node = trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[None] = key
+    return trie
+
+_ABBREVIATION_TRIE = _build_abbreviation_trie(ABBREVIATIONS)
+
+def _expand_punctuated(word: str) -> str:
+    """Expand a token that carries punctuation, keeping what follows the match."""
+    # clean word of punctuation for matching
+    word_clean = _NON_WORD_RE.sub('', word)
+    expansion = _ABBREVIATIONS.get(word_clean)
+    if expansion is None:
+        return word
+    # preserve any trailing punctuation
+    return expansion + word[len(word_clean):]
+
+def _expand_with_phrases(words: list) -> list:
+    """Expand tokens, taking the longest multi-word abbreviation at each position."""
     expanded = []
-
     i = 0
     while i < len(words):
-        word = words[i]
-
-        # clean word of punctuation for matching
-        word_clean = re.sub(r'[^\w]', '', word)
-
-        # check if word is an abbreviation
-        if word_clean in ABBREVIATIONS:
-            # preserve any trailing punctuation
-            trailing = ""
-            if word != word_clean:
-                trailing = word[len(word_clean):]
-            expanded.append(ABBREVIATIONS[word_clean] + trailing)
+        node, j, match_end = _ABBREVIATION_TRIE, i, None
+        while j < len(words):
+            node = node.get(_NON_WORD_RE.sub('', words[j]))
+            if node is None:
+                break
+            j += 1
+            if None in node:
+                match_end, key = j, node[None]
+
+        if match_end is None:
+            word = words[i]
+            expanded.append(
+                _ABBREVIATIONS.get(word, word) if word.isalnum() else _expand_punctuated(word)
+            )
+            i += 1
         else:
-            expanded.append(word)
+            # preserve any trailing punctuation of the last word
+            last = words[match_end - 1]
+            expanded.append(_ABBREVIATIONS[key] + last[len(_NON_WORD_RE.sub('', last)):])
+            i = match_end
 
-        i += 1
+    return expanded
 
-    return " ".join(expanded)
+@lru_cache(maxsize=4096)
+def expand_abbreviations(text: str) -> str:
+    """
+    Expand common text abbreviations to their full forms.
+    E.g., "idk y u r sad rn" → "i dont know why you are sad right now"
+    Results are memoized (chat messages repeat a lot), so keep it pure.
+    """
+    words = text.lower().split()
+    if _ABBREVIATION_TRIE:
+        return " ".join(_expand_with_phrases(words))
+    # most tokens are plain words (isalnum() is "all \w" bar underscores),
+    # which need a single dict lookup
+    return " ".join([
+        _ABBREVIATIONS.get(word, word) if word.isalnum() else _expand_punctuated(word)
+        for word in words
+    ])
 
 # ======================================================
 # HELPERS
 # ======================================================
 
 # words that are neutral even when elongated (hmmm, okayy, etc.)
-NEUTRAL_ELONGATED = {
+NEUTRAL_ELONGATED = frozenset({
     "hm", "hmm", "hmmm", "hmmmm", "hmmmmm",
     "um", "umm", "ummm", "ummmm",
     "ok", "okay", "okayy", "okayyy", "okayyyy",
@@ -1113,10 +1185,10 @@ NEUTRAL_ELONGATED = {
     "girl", "girll", "girlll",
     "sis", "siss", "sisss",
     "bestie", "bestiee", "bestieee"
-}
+})
 
 # words that indicate intensity/distress when elongated
-INTENSE_WORDS = {
+INTENSE_WORDS = frozenset({
     # curse words
     "shit", "fuck", "damn", "hell", "crap",
     "ass", "bitch", "dick", "cunt", "arse",
@@ -1149,27 +1221,125 @@ INTENSE_WORDS = {
     # exclamations (can be positive OR negative - context matters)
     "god", "lord", "jesus", "christ", "omg",
     "what", "why", "how"
-}
+})
+
+# patterns used on every message, compiled once
+_ELONGATED_RE = re.compile(r'(.)\1{2,}')
+_REPEAT_RE = re.compile(r'(.)\1+')
+_WORD_RE = re.compile(r"[a-zA-Z']+")
+_ELONGATED_WORD_RE = re.compile(r'\b\w*(.)\1{2,}\w*\b')
+# the lookahead lets the scanner skip positions that cannot start a break
+_SENTENCE_SPLIT_RE = re.compile(r'(?=[.!?\nabst])(?:[.!?\n]+|and then|but then|so then|then)')
+
+def _collapse_lower(lowered: str) -> str:
+    # for text that is already lowercase
+    return _ELONGATED_RE.sub(r'\1\1', lowered)
 
+@lru_cache(maxsize=4096)
 def collapse_elongated(text: str) -> str:
     """Collapse repeated characters: shiiit → shit, hmmmmm → hmm"""
-    return re.sub(r'(.)\1{2,}', r'\1\1', text.lower())
+    return _collapse_lower(text.lower())
+
+# token lists are memoized per text (short sentences and messages repeat);
+# the public functions hand out fresh lists each time
+
+def _token_pair(lowered: str, words) -> tuple:
+    """(plain tokens, collapsed tokens) as tuples, sharing one tokenization."""
+    tokens = tuple(map(lemmatize, words(lowered)))
+    # most text has no 3+ character runs, so collapsing would change nothing
+    if not _ELONGATED_RE.search(lowered):
+        return tokens, tokens
+    return tokens, tuple(map(lemmatize, words(_collapse_lower(lowered))))
+
+@lru_cache(maxsize=4096)
+def _normalized_pair(text: str) -> tuple:
+    return _token_pair(text.lower(), _WORD_RE.findall)
+
+@lru_cache(maxsize=4096)
+def _clean_pair(clean: str) -> tuple:
+    # preprocess_text output is already lowercase letters separated by
+    # single spaces, so a plain split gives the same words as _WORD_RE
+    return _token_pair(clean, str.split)
 
 def normalize(text: str):
-    words = re.findall(r"[a-zA-Z']+", text.lower())
-    return [lemmatizer.lemmatize(w) for w in words]
+    return list(_normalized_pair(text)[0])
 
 def normalize_with_collapse(text: str):
     """Normalize AND collapse elongated words for better matching"""
-    collapsed = collapse_elongated(text)
-    words = re.findall(r"[a-zA-Z']+", collapsed)
-    return [lemmatizer.lemmatize(w) for w in words]
+    return list(_normalized_pair(text)[1])
+
+def normalize_pair(text: str):
+    """normalize(text) and normalize_with_collapse(text) in one pass."""
+    tokens, tokens_collapsed = _normalized_pair(text)
+    return list(tokens), list(tokens_collapsed)
+
+def normalize_clean_pair(clean: str):
+    """normalize_pair for text that has been through preprocess_text."""
+    tokens, tokens_collapsed = _clean_pair(clean)
+    return list(tokens), list(tokens_collapsed)
 
 def has_any(tokens, vocab):
-    return any(w in tokens for w in vocab)
+    # one hash probe per token instead of scanning the token list per vocab word
+    return not vocab.isdisjoint(tokens)
+
+# category bits of WORD_FLAGS: every single-word bank in one table, so a
+# token is looked up once instead of once per bank
+POSITIVE_BIT = 1
+POSITIVE_INDICATOR_BIT = 2
+CURSE_BIT = 4
+SAD_BIT = 8
+DISTRESS_BIT = 16
+ANGER_BIT = 32
+
+def _build_word_flags(banks) -> dict:
+    flags = {}
+    for bank, bit in banks:
+        for word in bank:
+            flags[word] = flags.get(word, 0) | bit
+    return flags
+
+WORD_FLAGS = _build_word_flags([
+    (POSITIVE, POSITIVE_BIT),
+    (POSITIVE_INDICATORS, POSITIVE_INDICATOR_BIT),
+    (CONTEXT_CURSES, CURSE_BIT),
+    (SAD, SAD_BIT),
+    (DISTRESS, DISTRESS_BIT),
+    (ANGER, ANGER_BIT),
+])
+
+def word_flags(*token_lists) -> int:
+    """OR of the WORD_FLAGS bits of all tokens in the given lists."""
+    flags = 0
+    # the keys-view intersection runs in C; only matching words are visited
+    for word in WORD_FLAGS.keys() & chain.from_iterable(token_lists):
+        flags |= WORD_FLAGS[word]
+    return flags
+
+@lru_cache(maxsize=None)
+def _phrase_pattern(phrases):
+    """
+    One regex for a whole phrase bank, built from a character trie so
+    phrases sharing a prefix are tried together instead of one by one.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node):
+        # a shorter phrase already counts as a hit, so stop at its end
+        if "" in node:
+            return ""
+        alts = [re.escape(ch) + emit(child) for ch, child in node.items()]
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    return re.compile(emit(trie)) if phrases else None
 
 def has_phrase(text, phrases):
-    return any(p in text for p in phrases)
+    pattern = _phrase_pattern(phrases)
+    return pattern is not None and pattern.search(text) is not None
 
 def has_intensity(text):
     """
@@ -1178,14 +1348,13 @@ def has_intensity(text):
     """
     text_lower = text.lower()
 
-    # find all words with 3+ repeated characters
-    elongated_matches = re.findall(r'\b\w*(.)\1{2,}\w*\b', text_lower)
-    if not elongated_matches:
+    # bail out unless some word has 3+ repeated characters (first hit is enough)
+    if not _ELONGATED_WORD_RE.search(text_lower):
         return False
 
     # get the actual elongated words by splitting and checking each word
     words = text_lower.split()
-    elongated_words = [w for w in words if re.search(r'(.)\1{2,}', w)]
+    elongated_words = [w for w in words if _ELONGATED_RE.search(w)]
 
     for word in elongated_words:
         # skip if it's a known neutral word
@@ -1193,13 +1362,13 @@ def has_intensity(text):
             continue
 
         # collapse the word and check if base form is intense
-        collapsed = re.sub(r'(.)\1{2,}', r'\1\1', word)
-        collapsed_single = re.sub(r'(.)\1+', r'\1', word)
+        collapsed = _ELONGATED_RE.sub(r'\1\1', word)
+        collapsed_single = _REPEAT_RE.sub(r'\1', word)
 
-        # check if any intense word is in the collapsed form
-        for intense in INTENSE_WORDS:
-            if intense in collapsed or intense in collapsed_single:
-                return True
+        # check if any intense word is in the collapsed form (one trie-regex
+        # scan over both forms; split() tokens never contain a newline)
+        if has_phrase(collapsed + "\n" + collapsed_single, INTENSE_WORDS):
+            return True
 
         # if it's an elongated word not in neutral list, consider it intense
         # (catches things like "stooop", "nooooo" in distress context)
@@ -1212,6 +1381,42 @@ def has_intensity(text):
 # MAIN
 # ======================================================
 
+def clean_text(text: str) -> str:
+    # ✅ FIX TYPOS FIRST
+    # e.g., "im so sda and tird" → "im so sad and tired"
+    text_typo_fixed = normalize_text_with_typo_fix(text)
+
+    # ✅ EXPAND ABBREVIATIONS
+    # e.g., "idk y u r sad rn" → "i dont know why you are sad right now"
+    text_expanded = expand_abbreviations(text_typo_fixed)
+
+    return preprocess_text(text_expanded)
+
+def _features(cleaned):
+    # one transform per vectorizer and a single hstack for the whole batch
+    word_X = _word_vec().transform(cleaned)
+    char_X = _char_vec().transform(cleaned)
+    if len(cleaned) == 1:
+        # a single row is just both rows' entries back to back; building the
+        # CSR directly skips most of hstack's per-call overhead
+        data = np.concatenate([word_X.data, char_X.data])
+        indices = np.concatenate([word_X.indices, char_X.indices + word_X.shape[1]])
+        return csr_matrix(
+            (data, indices, np.array([0, data.size])),
+            shape=(1, word_X.shape[1] + char_X.shape[1])
+        )
+    return hstack([word_X, char_X], format="csr")
+
+def predict_batch(texts: List[str]) -> List[str]:
+    """
+    Raw ML labels for many texts at once (no rule overrides).
+    Much cheaper than calling the model per text for batch endpoints.
+    """
+    if not texts:
+        return []
+    cleaned = [clean_text(t) for t in texts]
+    return _model().predict(_features(cleaned)).tolist()
+
 def analyze_long_text(text: str) -> dict:
     """
     Analyze long paragraphs/rants by breaking into sentences and
@@ -1219,9 +1424,7 @@ def analyze_long_text(text: str) -> dict:
     Returns dict with emotion counts and key phrases found.
     """
     # Split by sentence endings and common breaks
-    import re
-    sentences = re.split(r'[.!?\n]+|(?:and then|but then|so then|then)', text.lower())
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text.lower())) if s]
 
     emotion_signals = {
         "positive": 0,
@@ -1234,8 +1437,7 @@ def analyze_long_text(text: str) -> dict:
     key_phrases_found = []
 
     for sentence in sentences:
-        tokens = normalize(sentence)
-        tokens_collapsed = normalize_with_collapse(sentence)
+        tokens, tokens_collapsed = _normalized_pair(sentence)
 
         # Check for exhaustion phrases (high priority)
         if has_phrase(sentence, EXHAUSTION_PHRASES):
@@ -1243,16 +1445,17 @@ def analyze_long_text(text: str) -> dict:
             key_phrases_found.append(("exhaustion", sentence[:50]))
 
         # Check word banks
-        if has_any(tokens, POSITIVE) or has_any(tokens_collapsed, POSITIVE):
+        flags = word_flags(tokens, tokens_collapsed)
+        if flags & POSITIVE_BIT:
             emotion_signals["positive"] += 1
 
-        if has_any(tokens, SAD) or has_any(tokens_collapsed, SAD):
+        if flags & SAD_BIT:
             emotion_signals["sad"] += 1
 
-        if has_any(tokens, ANGER) or has_any(tokens_collapsed, ANGER):
+        if flags & ANGER_BIT:
             emotion_signals["anger"] += 1
 
-        if has_any(tokens, DISTRESS) or has_any(tokens_collapsed, DISTRESS):
+        if flags & DISTRESS_BIT:
             emotion_signals["distress"] += 1
 
     return {
@@ -1263,44 +1466,102 @@ def analyze_long_text(text: str) -> dict:
     }
 
 def predict_emotion(text: str):
+    return predict_emotion_batch([text])[0]
 
-    # ✅ FIX: greetings shortcut
-    if text.strip().lower() in {"hey", "hi", "hello"}:
-        return {
-            "emotion": "neutral",
-            "score": 0.9
-        }
+def warm_up():
+    """
+    Load the model, vectorizers and lemmatizer and run one prediction,
+    so the first real request doesn't pay for it. Call at server startup.
+    """
+    # the uncached path: a synthetic text shouldn't occupy the result cache
+    text = "warming up the emotion model"
+    clean = clean_text(text)
+    model = _model()
+    probs = model.predict_proba(_features([clean]))
+    _apply_rules(text, clean, probs[0], model.classes_)
+    # bank words are the tokens that matter most; memoize their lemmas now
+    for word in WORD_FLAGS:
+        if " " not in word:
+            lemmatize(word)
+
+# Results are deterministic per text, and chat traffic repeats a lot (acks,
+# short replies, pasted messages), so recent results are kept in an LRU.
+# Only texts up to RESULT_CACHE_MAX_CHARS are cached to bound its memory.
+RESULT_CACHE_SIZE = 8192
+RESULT_CACHE_MAX_CHARS = 512
+
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+def _cached_result(text: str):
+    with _result_cache_lock:
+        result = _result_cache.get(text)
+        if result is not None:
+            _result_cache.move_to_end(text)
+        return result
+
+def _cache_result(text: str, result: dict):
+    if len(text) > RESULT_CACHE_MAX_CHARS:
+        return
+    with _result_cache_lock:
+        _result_cache[text] = (result["emotion"], result["score"])
+        _result_cache.move_to_end(text)
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+def predict_emotion_batch(texts: List[str]) -> List[Dict]:
+    """
+    Same as predict_emotion for many texts: the vectorizers and the model
+    run once over the whole batch, the rule overrides still run per text.
+    """
+    results = [None] * len(texts)
+    pending = []
+
+    for i, text in enumerate(texts):
+        # ✅ FIX: greetings shortcut
+        if text.strip().lower() in {"hey", "hi", "hello"}:
+            results[i] = {
+                "emotion": "neutral",
+                "score": 0.9
+            }
+            continue
 
-    # ✅ LONG TEXT / RANT ANALYSIS
-    # For longer messages, analyze sentence by sentence
-    long_analysis = analyze_long_text(text)
+        # callers get a fresh dict, never the cached entry
+        cached = _cached_result(text)
+        if cached is not None:
+            results[i] = {"emotion": cached[0], "score": cached[1]}
+        else:
+            pending.append(i)
 
-    # ✅ FIX TYPOS FIRST
-    # e.g., "im so sda and tird" → "im so sad and tired"
-    text_typo_fixed = normalize_text_with_typo_fix(text)
+    if not pending:
+        return results
 
-    # ✅ EXPAND ABBREVIATIONS
-    # e.g., "idk y u r sad rn" → "i dont know why you are sad right now"
-    text_expanded = expand_abbreviations(text_typo_fixed)
+    # -----------------------------
+    # ML PREDICTION
+    # -----------------------------
+    cleans = [clean_text(texts[i]) for i in pending]
+    model = _model()
+    probs = model.predict_proba(_features(cleans))
+    labels = model.classes_
 
-    clean = preprocess_text(text_expanded)
-    tokens = normalize(clean)
-    t = " ".join(tokens)
+    for row, i in enumerate(pending):
+        results[i] = _apply_rules(texts[i], cleans[row], probs[row], labels)
+        _cache_result(texts[i], results[i])
+
+    return results
+
+def _apply_rules(text: str, clean: str, probs, labels) -> dict:
 
     # ✅ FIX: also get collapsed tokens (shiiit → shit, hmmm → hmm)
-    tokens_collapsed = normalize_with_collapse(clean)
-    t_collapsed = " ".join(tokens_collapsed)
+    # the cached tuples are only read here, so no list copies are needed
+    tokens, tokens_collapsed = _clean_pair(clean)
+    t_both = " ".join(tokens)
 
-    # -----------------------------
-    # ML PREDICTION
-    # -----------------------------
-    X = hstack([
-        word_vec.transform([clean]),
-        char_vec.transform([clean])
-    ])
+    # phrases never contain a newline, so one scan of this covers both forms
+    # (without elongation both forms are the same tuple, scanned once)
+    if tokens_collapsed is not tokens:
+        t_both += "\n" + " ".join(tokens_collapsed)
 
-    probs = model.predict_proba(X)[0]
-    labels = model.classes_
     scores = dict(zip(labels, probs))
 
     emotion = max(scores, key=scores.get)
@@ -1313,18 +1574,19 @@ def predict_emotion(text: str):
 
     # ✅ CHECK FOR POSITIVE CURSE CONTEXT FIRST
     # (e.g., "holy shit thats amazing", "fuck yeah", "fucking finally")
-    has_positive_curse = has_phrase(t, POSITIVE_CURSE_CONTEXT) or has_phrase(t_collapsed, POSITIVE_CURSE_CONTEXT)
+    has_positive_curse = has_phrase(t_both, POSITIVE_CURSE_CONTEXT)
 
     # ✅ CHECK FOR POSITIVE INDICATORS (happy, excited, yay, worked, etc.)
-    has_positive_indicator = has_any(tokens, POSITIVE_INDICATORS) or has_any(tokens_collapsed, POSITIVE_INDICATORS)
+    flags = word_flags(tokens, tokens_collapsed)
+    has_positive_indicator = bool(flags & POSITIVE_INDICATOR_BIT)
 
     # ✅ If POSITIVE word + curse word together = POSITIVE (not distress)
     # e.g., "im so happy shit worked yayy" should be POSITIVE
-    has_curse = has_any(tokens, CONTEXT_CURSES) or has_any(tokens_collapsed, CONTEXT_CURSES)
+    has_curse = bool(flags & CURSE_BIT)
     positive_with_curse = has_positive_indicator and has_curse
 
     # check both normal tokens AND collapsed tokens for better matching
-    if has_any(tokens, POSITIVE) or has_any(tokens_collapsed, POSITIVE):
+    if flags & POSITIVE_BIT:
         internal = "positive"
 
     # ✅ If positive curse phrase detected, override to positive
@@ -1337,11 +1599,7 @@ def predict_emotion(text: str):
 
     # ✅ Only mark as distress if NOT a positive context
     if not has_positive_curse and not positive_with_curse:
-        if (
-            has_any(tokens, SAD) or has_any(tokens_collapsed, SAD)
-            or has_any(tokens, DISTRESS) or has_any(tokens_collapsed, DISTRESS)
-            or has_any(tokens, ANGER) or has_any(tokens_collapsed, ANGER)
-        ):
+        if flags & (SAD_BIT | DISTRESS_BIT | ANGER_BIT):
             internal = "distress"
 
     # -----------------------------
@@ -1362,9 +1620,8 @@ def predict_emotion(text: str):
         if (
             ("love" in tokens or "love" in tokens_collapsed)
             and (
-                has_any(tokens, ANGER) or has_any(tokens_collapsed, ANGER)
-                or has_any(tokens, DISTRESS) or has_any(tokens_collapsed, DISTRESS)
-                or has_phrase(t, EXHAUSTION_PHRASES) or has_phrase(t_collapsed, EXHAUSTION_PHRASES)
+                flags & (ANGER_BIT | DISTRESS_BIT)
+                or has_phrase(t_both, EXHAUSTION_PHRASES)
             )
         ):
             emotion = "distress"
@@ -1374,7 +1631,7 @@ def predict_emotion(text: str):
     # 🔴 FORCE STRONG DISTRESS (but not if positive context)
     # -----------------------------
     if not has_positive_curse and not positive_with_curse:
-        if has_intensity(clean) or has_phrase(t, EXHAUSTION_PHRASES) or has_phrase(t_collapsed, EXHAUSTION_PHRASES):
+        if has_intensity(clean) or has_phrase(t_both, EXHAUSTION_PHRASES):
             emotion = "strong_distress"
             score = max(score, 0.85)
 
@@ -1382,7 +1639,12 @@ def predict_emotion(text: str):
     # 📝 LONG TEXT / RANT HANDLING
     # For longer messages, use aggregated signals
     # -----------------------------
-    if long_analysis["is_long"] and not has_positive_curse and not positive_with_curse:
+    # the sentence-by-sentence pass is skipped when it cannot change anything
+    long_analysis = None
+    if not has_positive_curse and not positive_with_curse:
+        long_analysis = analyze_long_text(text)
+
+    if long_analysis is not None and long_analysis["is_long"]:
         signals = long_analysis["signals"]
 
         # Calculate negative signals total
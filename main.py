@@ -1,13 +1,95 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from inference.predict_emotion import predict_emotion
 
-app = FastAPI()
+import config
+from inference.predict_emotion import predict_emotion, predict_emotion_batch, warm_up
+
+# (text, future) pairs waiting to be scored by the batch worker
+_pending = None
+_worker = None
+
+
+async def _batch_worker():
+    loop = asyncio.get_running_loop()
+    window = config.PREDICT_BATCH_WINDOW_MS / 1000
+
+    while True:
+        batch = [await _pending.get()]
+        deadline = loop.time() + window
+
+        # collect whatever else arrives within the window
+        while len(batch) < config.PREDICT_MAX_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_pending.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        texts = [text for text, _ in batch]
+        try:
+            # off the event loop so new requests keep queueing meanwhile
+            results = await loop.run_in_executor(None, predict_emotion_batch, texts)
+        except Exception:
+            # one bad text must not fail the requests batched with it:
+            # score them one by one so only the culprit gets the error
+            for text, future in batch:
+                try:
+                    result = await loop.run_in_executor(None, predict_emotion, text)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            continue
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def _worker_running():
+    return (
+        _worker is not None
+        and not _worker.done()
+        and _worker.get_loop() is asyncio.get_running_loop()
+    )
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global _pending, _worker
+    warm_up()
+    _pending = asyncio.Queue()
+    _worker = asyncio.create_task(_batch_worker())
+    try:
+        yield
+    finally:
+        _worker.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+
 
 @app.get("/")
 def health():
     return {"status": "ok"}
 
 @app.post("/predict")
-def predict(payload: dict):
+async def predict(payload: dict):
     text = payload.get("text", "")
-    return predict_emotion(text)
+    if not isinstance(text, str):
+        text = "" if text is None else str(text)
+
+    loop = asyncio.get_running_loop()
+    if not _worker_running():
+        # lifespan never ran (e.g. mounted as a sub-app): score directly
+        return await loop.run_in_executor(None, predict_emotion, text)
+
+    future = loop.create_future()
+    await _pending.put((text, future))
+    return await future
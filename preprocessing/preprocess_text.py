@@ -2,13 +2,28 @@
 
 import re
 
+_URL_RE = re.compile(r"http\S+|www\S+")
+_NON_ALPHA_RE = re.compile(r"[^a-z\s]")
+
+# ASCII text (almost every message) maps [^a-z\s] to spaces via translate;
+# anything else still goes through _NON_ALPHA_RE
+_NON_ALPHA_TABLE = str.maketrans({
+    c: " " for c in range(128)
+    if not ("a" <= chr(c) <= "z" or chr(c).isspace())
+})
+
 def preprocess_text(text: str) -> str:
     if not isinstance(text, str):
         return ""
 
     text = text.lower()
-    text = re.sub(r"http\S+|www\S+", "", text)
-    text = re.sub(r"[^a-z\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    if "http" in text or "www" in text:
+        text = _URL_RE.sub("", text)
+    if text.isascii():
+        text = text.translate(_NON_ALPHA_TABLE)
+    else:
+        text = _NON_ALPHA_RE.sub(" ", text)
+    # str.split() uses the same whitespace definition as \s
+    text = " ".join(text.split())
 
     return text
@@ -2,12 +2,14 @@
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+from types import MappingProxyType
 
 # ======================================================
 # COMMON TYPO MAPPINGS
 # ======================================================
 
-TYPO_CORRECTIONS = {
+_TYPO_CORRECTIONS = {
     # pain / hurt variations
     "pian": "pain", "paine": "pain", "painn": "pain", "pein": "pain",
     "pani": "pain", "apni": "pain", "pina": "pain", "paain": "pain",
@@ -29,14 +31,14 @@ TYPO_CORRECTIONS = {
 
     # hate variations
     "haet": "hate", "htae": "hate", "hste": "hate", "hatee": "hate",
-    "hateee": "hate", "ahte": "hate", "haye": "hate", "hte": "hate",
+    "hateee": "hate", "ahte": "hate", "haye": "hate",
 
     # stressed variations
     "stresed": "stressed", "stressd": "stressed", "stessed": "stressed",
     "streesed": "stressed", "strssed": "stressed", "stresssed": "stressed",
     "stressedd": "stressed", "stresedd": "stressed", "streessed": "stressed",
     "stresses": "stressed", "stressss": "stressed", "streesss": "stressed",
-    "stresss": "stressed", "stresss": "stressed", "stressin": "stressing",
+    "stresss": "stressed", "stressin": "stressing",
     "stressingg": "stressing", "stresin": "stressing", "stresing": "stressing",
 
     # depressed variations
@@ -143,9 +145,9 @@ TYPO_CORRECTIONS = {
 
     # common typos for expressions
     "ughhh": "ugh", "ughh": "ugh", "ugg": "ugh", "uhg": "ugh",
-    "omgg": "omg", "omggg": "omg", "ogm": "omg", "omgod": "omg",
+    "omggg": "omg", "ogm": "omg", "omgod": "omg",
     "wtff": "wtf", "wft": "wtf", "wtfff": "wtf",
-    "wthh": "wth", "wht": "wth", "wthh": "wth",
+    "wht": "wth", "wthh": "wth",
 
     # emotion words typos
     "hapy": "happy", "happpy": "happy", "hpapy": "happy", "happyy": "happy",
@@ -158,24 +160,24 @@ TYPO_CORRECTIONS = {
     "teh": "the", "hte": "the", "tthe": "the",
     "adn": "and", "nad": "and", "andd": "and",
     "taht": "that", "htat": "that", "thta": "that",
-    "jsut": "just", "juts": "just", "jst": "just",
-    "dont": "don't", "dnt": "don't", "dontt": "don't",
-    "cant": "can't", "cnat": "can't", "cantt": "can't",
-    "wont": "won't", "wnt": "won't", "wontt": "won't",
-    "im": "i'm", "iam": "i'm", "imm": "i'm",
-    "youre": "you're", "ur": "you're", "yuor": "your",
+    "jsut": "just", "juts": "just",
+    "dnt": "don't", "dontt": "don't",
+    "cnat": "can't", "cantt": "can't",
+    "wnt": "won't", "wontt": "won't",
+    "iam": "i'm", "imm": "i'm",
+    "yuor": "your",
     "thier": "their", "tehir": "their", "theri": "their",
     "becuase": "because", "becasue": "because", "beacuse": "because",
     "becuse": "because", "bcause": "because", "bcuz": "because",
-    "somthing": "something", "somethign": "something", "smth": "something",
+    "somthing": "something", "somethign": "something",
     "nothign": "nothing", "ntohing": "nothing", "nthing": "nothing",
     "evrything": "everything", "everythign": "everything", "everthing": "everything",
     "anyting": "anything", "anythign": "anything", "anythin": "anything",
-    "poeple": "people", "peopel": "people", "ppl": "people",
-    "realy": "really", "relly": "really", "reallly": "really",
+    "poeple": "people", "peopel": "people",
+    "realy": "really", "reallly": "really",
     "actualy": "actually", "actaully": "actually", "acutally": "actually",
     "definetly": "definitely", "definately": "definitely", "defintely": "definitely",
-    "probaly": "probably", "probbaly": "probably", "prolly": "probably",
+    "probaly": "probably", "probbaly": "probably",
 
     # feelings / states
     "emtpy": "empty", "emptty": "empty", "emty": "empty",
@@ -210,7 +212,7 @@ TYPO_CORRECTIONS = {
     "def": "definitely", "deffo": "definitely", "defs": "definitely",
     "defo": "definitely", "defn": "definitely",
     "tbh": "to be honest", "tbe": "to be honest",
-    "ngl": "not gonna lie", "ngl": "not gonna lie",
+    "ngl": "not gonna lie",
     "imo": "in my opinion", "imho": "in my humble opinion",
     "idk": "i dont know", "idek": "i dont even know",
     "idc": "i dont care", "idrc": "i dont really care",
@@ -232,7 +234,7 @@ TYPO_CORRECTIONS = {
     "ikr": "i know right", "fr": "for real", "frfr": "for real for real",
     "ong": "on god", "istg": "i swear to god", "stg": "swear to god",
     "lowkey": "low key", "highkey": "high key",
-    "nbd": "no big deal", "np": "no problem", "nw": "no worries",
+    "nbd": "no big deal", "nw": "no worries",
     "jk": "just kidding", "jks": "just kidding", "jp": "just playing",
     "lol": "laughing out loud", "lmao": "laughing my ass off",
     "lmfao": "laughing my fucking ass off", "rofl": "rolling on floor laughing",
@@ -312,6 +314,9 @@ TYPO_CORRECTIONS = {
     "ghosted": "ignored", "ratio": "outvoted",
 }
 
+# read-only view for importers; lookups here go to the backing dict
+TYPO_CORRECTIONS = MappingProxyType(_TYPO_CORRECTIONS)
+
 # ======================================================
 # KEYBOARD PROXIMITY (for smart typo detection)
 # ======================================================
@@ -363,12 +368,16 @@ def similarity_ratio(word1: str, word2: str) -> float:
     return SequenceMatcher(None, word1.lower(), word2.lower()).ratio()
 
 
+# hash lookups instead of scanning the neighbor lists
+_NEIGHBOR_SETS = {
+    char: frozenset(neighbors) for char, neighbors in KEYBOARD_NEIGHBORS.items()
+}
+
+
 def is_keyboard_typo(char1: str, char2: str) -> bool:
     """Check if two characters are keyboard neighbors (likely typo)."""
-    char1, char2 = char1.lower(), char2.lower()
-    if char1 in KEYBOARD_NEIGHBORS:
-        return char2 in KEYBOARD_NEIGHBORS[char1]
-    return False
+    neighbors = _NEIGHBOR_SETS.get(char1.lower())
+    return neighbors is not None and char2.lower() in neighbors
 
 
 def find_best_match(word: str, vocabulary: set, threshold: float = 0.7) -> str:
@@ -379,20 +388,73 @@ def find_best_match(word: str, vocabulary: set, threshold: float = 0.7) -> str:
     if len(word_lower) < 3:
         return word
 
+    # Quick length check - skip if lengths differ too much
+    candidates = [
+        (vocab_word.lower(), vocab_word) for vocab_word in vocabulary
+        if abs(len(word_lower) - len(vocab_word)) <= 3
+    ]
+
+    best_match = _closest(word_lower, candidates, threshold)
+    return best_match if best_match else word
+
+
+@lru_cache(maxsize=64)
+def _emotion_candidates(length: int) -> tuple:
+    """EMOTION_VOCABULARY words within 3 characters of length, in set order."""
+    # the vocabulary is all lowercase already
+    return tuple(
+        (vocab_word, vocab_word) for vocab_word in EMOTION_VOCABULARY
+        if abs(length - len(vocab_word)) <= 3
+    )
+
+
+def _closest(word_lower: str, candidates, threshold: float):
+    """
+    Most similar candidate scoring >= threshold (first wins ties), or None.
+    candidates are (lowercased form, word to return) pairs, so nothing is
+    lowercased again per comparison.
+    """
     best_match = None
     best_score = 0
 
-    for vocab_word in vocabulary:
-        # Quick length check - skip if lengths differ too much
-        if abs(len(word_lower) - len(vocab_word)) > 3:
+    # one matcher for the whole scan; real_quick_ratio() and quick_ratio()
+    # are cheap upper bounds on ratio(), so candidates that cannot reach the
+    # threshold or beat the current best skip the full comparison
+    matcher = SequenceMatcher(None, word_lower)
+
+    for vocab_lower, vocab_word in candidates:
+        matcher.set_seq2(vocab_lower)
+        bound = matcher.real_quick_ratio()
+        if bound < threshold or bound <= best_score:
+            continue
+        bound = matcher.quick_ratio()
+        if bound < threshold or bound <= best_score:
             continue
 
-        score = similarity_ratio(word_lower, vocab_word)
+        score = matcher.ratio()
         if score > best_score and score >= threshold:
             best_score = score
             best_match = vocab_word
 
-    return best_match if best_match else word
+    return best_match
+
+
+@lru_cache(maxsize=8192)
+def _correction_for(word_lower: str):
+    """Correction for a lowercased word, or None if it should stay as is."""
+    # Direct mapping lookup
+    if word_lower in _TYPO_CORRECTIONS:
+        return _TYPO_CORRECTIONS[word_lower]
+
+    # Fuzzy match for emotion words (only if word is 4+ chars)
+    # (same as find_best_match over EMOTION_VOCABULARY, with the length
+    # filter precomputed per word length)
+    if len(word_lower) >= 4:
+        match = _closest(word_lower, _emotion_candidates(len(word_lower)), 0.75)
+        if match is not None and match != word_lower:
+            return match
+
+    return None
 
 
 def correct_typo(word: str) -> str:
@@ -400,20 +462,28 @@ def correct_typo(word: str) -> str:
     Correct a single word typo.
     1. First check direct mapping
     2. Then try fuzzy matching with emotion vocabulary
+    Results are memoized per lowercased word, since chat tokens repeat a lot.
     """
-    word_lower = word.lower()
+    correction = _correction_for(word.lower())
+    return word if correction is None else correction
 
-    # Direct mapping lookup
-    if word_lower in TYPO_CORRECTIONS:
-        return TYPO_CORRECTIONS[word_lower]
 
-    # Fuzzy match for emotion words (only if word is 4+ chars)
-    if len(word_lower) >= 4:
-        match = find_best_match(word_lower, EMOTION_VOCABULARY, threshold=0.75)
-        if match != word_lower:
-            return match
+# The part of a token between its first and last alphanumeric character
+# ([^\W_] matches exactly what str.isalnum() accepts)
+_WORD_CORE_RE = re.compile(r"[^\W_](?:\S*[^\W_])?")
 
-    return word
+
+@lru_cache(maxsize=8192)
+def _fix_word(word: str) -> str:
+    """Correct one whitespace-separated token, preserving its punctuation."""
+    if word.isalnum():
+        return correct_typo(word)
+
+    core = _WORD_CORE_RE.search(word)
+    if core is None:
+        return word
+
+    return word[:core.start()] + correct_typo(core.group()) + word[core.end():]
 
 
 def fix_typos(text: str) -> str:
@@ -424,31 +494,10 @@ def fix_typos(text: str) -> str:
     if not isinstance(text, str):
         return ""
 
-    words = text.split()
-    corrected = []
-
-    for word in words:
-        # Preserve punctuation
-        prefix = ""
-        suffix = ""
+    return " ".join(map(_fix_word, text.split()))
 
-        # Extract leading punctuation
-        while word and not word[0].isalnum():
-            prefix += word[0]
-            word = word[1:]
 
-        # Extract trailing punctuation
-        while word and not word[-1].isalnum():
-            suffix = word[-1] + suffix
-            word = word[:-1]
-
-        if word:
-            corrected_word = correct_typo(word)
-            corrected.append(prefix + corrected_word + suffix)
-        else:
-            corrected.append(prefix + suffix)
-
-    return " ".join(corrected)
+_REPEAT_RE = re.compile(r'(.)\1{3,}')
 
 
 def fix_repeated_chars(text: str) -> str:
@@ -458,7 +507,7 @@ def fix_repeated_chars(text: str) -> str:
     Keeps max 3 repeated chars for expression, 2 for normal words.
     """
     # For expressive words (ugh, omg, etc.) keep up to 3
-    text = re.sub(r'(.)\1{3,}', r'\1\1\1', text)
+    text = _REPEAT_RE.sub(r'\1\1\1', text)
     return text
 
 
@@ -467,10 +516,16 @@ def normalize_text_with_typo_fix(text: str) -> str:
     Full text normalization with typo fixing.
     1. Fix repeated characters
     2. Fix known typos
+    Memoized per message; short messages ("idk", "im sad") repeat a lot.
     """
     if not isinstance(text, str):
         return ""
 
+    return _normalize_message(text)
+
+
+@lru_cache(maxsize=16384)
+def _normalize_message(text: str) -> str:
     text = text.lower()
     text = fix_repeated_chars(text)
     text = fix_typos(text)
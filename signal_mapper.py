@@ -4,28 +4,59 @@ Signal Mapper - Maps predictions to signals and analyzes patterns
 Handles signal counting for pattern-based response selection
 """
 
+import re
+from functools import lru_cache
+
+import numpy as np
+
 # ======================================================
 # SIGNAL MAPPING
 # ======================================================
 
+# (strong, moderate, weak) signal per prediction; anything else is NEUTRAL
+SIGNAL_LEVELS = {
+    "distress": ("STRONG_DISTRESS", "MODERATE_DISTRESS", "WEAK_DISTRESS"),
+    "positive": ("STRONG_POSITIVE", "MODERATE_POSITIVE", "WEAK_POSITIVE"),
+}
+
+
 def map_signal(prediction, confidence):
     """Map a single prediction to a signal level."""
-    if prediction == "distress":
-        if confidence >= 0.80:
-            return "STRONG_DISTRESS"
-        elif confidence >= 0.65:
-            return "MODERATE_DISTRESS"
-        else:
-            return "WEAK_DISTRESS"
-    elif prediction == "positive":
-        if confidence >= 0.80:
-            return "STRONG_POSITIVE"
-        elif confidence >= 0.65:
-            return "MODERATE_POSITIVE"
-        else:
-            return "WEAK_POSITIVE"
-    else:
+    levels = SIGNAL_LEVELS.get(prediction)
+    if levels is None:
         return "NEUTRAL"
+    if confidence >= 0.80:
+        return levels[0]
+    elif confidence >= 0.65:
+        return levels[1]
+    else:
+        return levels[2]
+
+
+def map_signals(predictions, confidences):
+    """
+    map_signal over whole batches of model output.
+    Returns a NumPy string array of signal levels, one per prediction.
+    """
+    predictions = np.asarray(predictions)
+    confidences = np.asarray(confidences, dtype=float)
+
+    distress = predictions == "distress"
+    positive = predictions == "positive"
+    strong = confidences >= 0.80
+    moderate = confidences >= 0.65
+
+    return np.select(
+        [
+            distress & strong, distress & moderate, distress,
+            positive & strong, positive & moderate, positive,
+        ],
+        [
+            "STRONG_DISTRESS", "MODERATE_DISTRESS", "WEAK_DISTRESS",
+            "STRONG_POSITIVE", "MODERATE_POSITIVE", "WEAK_POSITIVE",
+        ],
+        default="NEUTRAL"
+    )
 
 
 # ======================================================
@@ -33,7 +64,7 @@ def map_signal(prediction, confidence):
 # ======================================================
 
 # Keywords/phrases for detecting distress signals in text
-DISTRESS_KEYWORDS = {
+DISTRESS_KEYWORDS = frozenset({
     # strong distress
     "cant take it", "can't take it", "cant do this", "can't do this",
     "want to die", "wanna die", "kill myself", "end it all", "give up",
@@ -79,12 +110,12 @@ DISTRESS_KEYWORDS = {
     # single word emotions (important!)
     "hate", "sucks", "awful", "terrible", "horrible", "worst",
     "ugh", "ughh", "ughhh", "argh", "arghhh", "fml", "smh",
-    "crying", "cried", "cry", "sobbing", "sobbed",
+    "cried", "cry", "sobbed",
     "dying", "dead", "done", "finished", "ruined",
     "failed", "failing", "failure", "loser",
     "pathetic", "stupid", "idiot", "dumb",
     "boring", "bored", "suck", "hate it", "hate this",
-    "i hate", "so tired", "so stressed", "so sad", "so done",
+    "i hate", "so tired", "so stressed", "so sad",
     "im sad", "i'm sad", "im tired", "i'm tired",
     "im stressed", "i'm stressed", "im anxious", "i'm anxious",
     "im depressed", "i'm depressed", "im lonely", "i'm lonely",
@@ -97,7 +128,7 @@ DISTRESS_KEYWORDS = {
     "feeling scared", "feeling worried", "feeling upset",
     "feeling angry", "feeling frustrated", "feeling annoyed",
     "feeling bad", "feeling terrible", "feeling awful",
-    "feeling horrible", "feeling down", "feeling low",
+    "feeling horrible", "feeling low",
     "not happy", "unhappy", "dissatisfied", "disappointed",
     "disappointing", "heartbreak", "painful", "pain",
     # more common words
@@ -106,7 +137,7 @@ DISTRESS_KEYWORDS = {
     "annoying", "irritating", "frustrating", "stressful",
     "overwhelming", "exhausting", "draining", "tiring",
     "depressing", "upsetting", "hurtful", "scary", "terrifying",
-    "anxious", "nervous", "worried", "stressed", "panicking",
+    "panicking",
     "freaking out", "losing my mind", "going insane",
     "cant sleep", "can't sleep", "insomnia", "restless",
     "headache", "migraine", "sick", "ill", "unwell",
@@ -114,7 +145,7 @@ DISTRESS_KEYWORDS = {
     "helpless", "powerless", "weak", "vulnerable",
     "rejected", "abandoned", "ignored", "neglected",
     "betrayed", "cheated", "lied to", "used",
-    "embarrassed", "humiliated", "ashamed", "guilty",
+    "embarrassed", "ashamed", "guilty",
     "regret", "remorse", "sorry", "apologize",
     "confused", "lost", "uncertain", "unsure", "doubtful",
     "numb", "detached", "disconnected", "empty inside",
@@ -122,7 +153,7 @@ DISTRESS_KEYWORDS = {
     "died", "passed away", "passed on", "lost my", "death",
     "funeral", "grieving", "grief", "mourning", "miss them",
     "miss her", "miss him", "gone forever", "never coming back",
-    "lost someone", "loved one", "heartbroken", "devastated",
+    "lost someone", "loved one",
     "broke up", "breakup", "dumped", "left me", "divorced",
     # humiliation / degradation
     "humiliated", "humiliates", "humiliating", "humiliation",
@@ -160,10 +191,10 @@ DISTRESS_KEYWORDS = {
     "want quiet", "need quiet", "want silence", "need silence",
     "want to be left alone", "leave me alone", "need space", "need a break",
     "need to escape", "want to escape", "want to run away", "need to get away"
-}
+})
 
 # Keywords/phrases for detecting positive signals in text
-POSITIVE_KEYWORDS = {
+POSITIVE_KEYWORDS = frozenset({
     # strong positive
     "so happy", "really happy", "super happy", "extremely happy",
     "best day", "amazing", "incredible", "fantastic", "wonderful",
@@ -179,41 +210,98 @@ POSITIVE_KEYWORDS = {
     "okay", "fine", "alright", "not bad", "pretty good", "decent",
     "better", "improving", "getting better", "doing okay",
     "feeling good", "feeling better", "feeling positive"
-}
+})
 
 # Neutral indicators
-NEUTRAL_KEYWORDS = {
+NEUTRAL_KEYWORDS = frozenset({
     "idk", "dunno", "whatever", "nothing much", "just chilling",
     "bored", "meh", "same old", "nothing new", "just here",
     "normal", "regular", "usual", "typical", "average"
+})
+
+
+def _keyword_pattern(keywords):
+    """
+    One regex for a whole keyword set, built from a character trie. Inside
+    the lookahead it matches, at every position, the longest keyword that
+    starts there, so a single finditer pass replaces one scan per keyword.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node):
+        alts = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if not alts:
+            return ""
+        body = "(?:" + "|".join(alts) + ")"
+        # a keyword ends here: try to extend it first, else stop
+        return body + "?" if "" in node else body
+
+    return re.compile("(?=(" + emit(trie) + "))")
+
+
+_ALL_KEYWORDS = DISTRESS_KEYWORDS | POSITIVE_KEYWORDS | NEUTRAL_KEYWORDS
+_KEYWORD_RE = _keyword_pattern(_ALL_KEYWORDS)
+
+# one bit per keyword: a scan ORs masks together and each count is the
+# popcount of its kind's bits, so every keyword is counted at most once
+_KEYWORD_BIT = {
+    keyword: 1 << i for i, keyword in enumerate(sorted(_ALL_KEYWORDS))
 }
 
 
+def _mask(keywords) -> int:
+    mask = 0
+    for keyword in keywords:
+        mask |= _KEYWORD_BIT[keyword]
+    return mask
+
+
+_DISTRESS_MASK = _mask(DISTRESS_KEYWORDS)
+_POSITIVE_MASK = _mask(POSITIVE_KEYWORDS)
+_NEUTRAL_MASK = _mask(NEUTRAL_KEYWORDS)
+
+# the keywords found at a position are the longest match and every
+# keyword that is a prefix of it
+_KEYWORD_PREFIX_MASK = {
+    keyword: _mask(
+        keyword[:i] for i in range(1, len(keyword) + 1)
+        if keyword[:i] in _ALL_KEYWORDS
+    )
+    for keyword in _ALL_KEYWORDS
+}
+
+
+def _keyword_mask(text_lower: str) -> int:
+    """Bitmask of every keyword occurring anywhere in text_lower (substring match)."""
+    found = 0
+    for match in _KEYWORD_RE.finditer(text_lower):
+        found |= _KEYWORD_PREFIX_MASK[match.group(1)]
+    return found
+
+
+@lru_cache(maxsize=4096)
+def _keyword_counts(text: str) -> tuple:
+    """(distress, positive, neutral) distinct keyword counts for text."""
+    found = _keyword_mask(text.lower())
+    return (
+        bin(found & _DISTRESS_MASK).count("1"),
+        bin(found & _POSITIVE_MASK).count("1"),
+        bin(found & _NEUTRAL_MASK).count("1"),
+    )
+
+
 def count_signals_in_text(text: str) -> dict:
     """
     Count distress and positive signals in text.
     Returns dict with counts and dominant signal type.
     """
-    text_lower = text.lower()
-
-    distress_count = 0
-    positive_count = 0
-    neutral_count = 0
-
-    # Count distress keywords
-    for keyword in DISTRESS_KEYWORDS:
-        if keyword in text_lower:
-            distress_count += 1
-
-    # Count positive keywords
-    for keyword in POSITIVE_KEYWORDS:
-        if keyword in text_lower:
-            positive_count += 1
-
-    # Count neutral keywords
-    for keyword in NEUTRAL_KEYWORDS:
-        if keyword in text_lower:
-            neutral_count += 1
+    # memoized: the reply path scans the same message several times
+    distress_count, positive_count, neutral_count = _keyword_counts(text)
 
     # Determine dominant signal
     if distress_count >= 3: